@@ -0,0 +1,226 @@
+"""Shared response cache for the example drivers.
+
+Every example command is a full LLM round-trip, so repeat runs of the
+same static command lists pay network latency for identical answers.
+This module wraps ``agent.run_sync`` with an exact-match cache keyed by
+SHA-256 of (model id + prompt), backed by a small SQLite file, so a
+cache hit returns in milliseconds with zero tokens spent.
+
+On top of the exact-match layer there is an optional semantic cache:
+prompts that differ only in phrasing are matched by cosine similarity
+over MiniLM sentence embeddings (FAISS ``IndexFlatIP`` on normalized
+vectors). It activates only when ``faiss`` and ``sentence-transformers``
+are installed; otherwise lookups silently fall back to exact match.
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+from pathlib import Path
+
+CACHE_DB_PATH = Path.home() / ".agent_demo_cache.sqlite"
+
+# Cosine similarity above which a stored prompt counts as a semantic hit.
+SEMANTIC_SIMILARITY_THRESHOLD = 0.92
+
+# Single module-level connection shared by all example functions.
+_connection = None
+
+# Optional semantic layer; populated lazily by _get_semantic_index().
+try:
+    import faiss
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    _semantic_available = True
+except Exception:
+    _semantic_available = False
+
+_embedder = None
+_semantic_index = None
+_semantic_outputs: list = []
+
+# Prompt -> normalized embedding, filled by warm() so known-static
+# prompts never pay per-prompt encoding cost at lookup time.
+_embedding_memo: dict = {}
+
+
+class _CachedResult:
+    """Minimal stand-in for a pydantic_ai result on cache hits."""
+
+    def __init__(self, output: str):
+        self.output = output
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Open (once) the cache database, creating the schema if needed."""
+    global _connection
+    if _connection is None:
+        _connection = sqlite3.connect(CACHE_DB_PATH)
+        _connection.execute("PRAGMA journal_mode=WAL")
+        _connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, output TEXT)"
+        )
+        _connection.commit()
+    return _connection
+
+
+def _model_id(agent) -> str:
+    """Best-effort stable identifier for the agent's model."""
+    model = getattr(agent, "model", None)
+    return getattr(model, "model_name", None) or str(model)
+
+
+def _cache_key(agent, prompt: str) -> str:
+    return hashlib.sha256((_model_id(agent) + prompt).encode("utf-8")).hexdigest()
+
+
+def _get_semantic_index():
+    """Build (once) the FAISS index over previously cached prompts.
+
+    Returns None when the optional embedding dependencies are missing.
+    """
+    global _embedder, _semantic_index
+    if not _semantic_available:
+        return None
+    if _semantic_index is None:
+        _embedder = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+        dim = _embedder.get_sentence_embedding_dimension()
+        _semantic_index = faiss.IndexFlatIP(dim)
+
+        # Warm the index from rows cached in previous runs.
+        conn = _get_connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS semantic_cache "
+            "(id INTEGER PRIMARY KEY, prompt TEXT, output TEXT)"
+        )
+        conn.commit()
+        rows = conn.execute(
+            "SELECT prompt, output FROM semantic_cache ORDER BY id"
+        ).fetchall()
+        if rows:
+            embeddings = _embed([prompt for prompt, _ in rows])
+            _semantic_index.add(embeddings)
+            _semantic_outputs.extend(output for _, output in rows)
+    return _semantic_index
+
+
+def _embed(prompts):
+    """Embed prompts as L2-normalized float32 vectors (for cosine via IP).
+
+    Single-prompt calls are served from the warm() memo when possible.
+    """
+    if len(prompts) == 1 and prompts[0] in _embedding_memo:
+        return _embedding_memo[prompts[0]][None, :]
+    vectors = _embedder.encode(prompts, convert_to_numpy=True, show_progress_bar=False)
+    vectors = vectors.astype(np.float32)
+    faiss.normalize_L2(vectors)
+    return vectors
+
+
+def warm(prompts) -> None:
+    """Pre-embed static prompts in one batched encode call.
+
+    Example drivers know their command lists at import time; batch
+    encoding them here (~10x faster than per-prompt calls) means first-
+    run semantic lookups and stores skip the embedding step. No-op when
+    the embedding dependencies are missing.
+    """
+    if _get_semantic_index() is None:
+        return
+    missing = [p for p in dict.fromkeys(prompts) if p not in _embedding_memo]
+    if not missing:
+        return
+    vectors = _embed(missing)
+    for prompt, vector in zip(missing, vectors):
+        _embedding_memo[prompt] = vector
+
+
+def _semantic_lookup(prompt: str):
+    """Return a cached output for a near-duplicate prompt, or None."""
+    index = _get_semantic_index()
+    if index is None or index.ntotal == 0:
+        return None
+    scores, ids = index.search(_embed([prompt]), 1)
+    if scores[0][0] >= SEMANTIC_SIMILARITY_THRESHOLD:
+        return _semantic_outputs[ids[0][0]]
+    return None
+
+
+def _semantic_store(prompt: str, output: str) -> None:
+    """Add a freshly computed (prompt, output) pair to the semantic layer."""
+    index = _get_semantic_index()
+    if index is None:
+        return
+    index.add(_embed([prompt]))
+    _semantic_outputs.append(output)
+    conn = _get_connection()
+    conn.execute(
+        "INSERT INTO semantic_cache (prompt, output) VALUES (?, ?)",
+        (prompt, output),
+    )
+    conn.commit()
+
+
+def cached_run_sync(agent, prompt: str):
+    """Run ``agent.run_sync(prompt)``, serving repeats from the cache.
+
+    Lookup order is exact SHA-256 match first, then (when the optional
+    embedding dependencies are installed) semantic similarity. Returns
+    the real pydantic_ai result on a miss, or a lightweight object
+    exposing the same ``.output`` attribute on a hit.
+    """
+    conn = _get_connection()
+    key = _cache_key(agent, prompt)
+
+    row = conn.execute("SELECT output FROM cache WHERE key=?", (key,)).fetchone()
+    if row is not None:
+        return _CachedResult(row[0])
+
+    semantic_hit = _semantic_lookup(prompt)
+    if semantic_hit is not None:
+        return _CachedResult(semantic_hit)
+
+    result = agent.run_sync(prompt)
+    conn.execute(
+        "INSERT OR REPLACE INTO cache (key, output) VALUES (?, ?)",
+        (key, result.output),
+    )
+    conn.commit()
+    _semantic_store(prompt, result.output)
+    return result
+
+
+async def cached_run(agent, prompt: str):
+    """Async variant of :func:`cached_run_sync` built on ``agent.run``."""
+    conn = _get_connection()
+    key = _cache_key(agent, prompt)
+
+    row = conn.execute("SELECT output FROM cache WHERE key=?", (key,)).fetchone()
+    if row is not None:
+        return _CachedResult(row[0])
+
+    semantic_hit = _semantic_lookup(prompt)
+    if semantic_hit is not None:
+        return _CachedResult(semantic_hit)
+
+    result = await agent.run(prompt)
+    conn.execute(
+        "INSERT OR REPLACE INTO cache (key, output) VALUES (?, ?)",
+        (key, result.output),
+    )
+    conn.commit()
+    _semantic_store(prompt, result.output)
+    return result
+
+
+def run_commands_concurrently(agent, commands):
+    """Run independent commands in parallel and return ordered results.
+
+    The commands are I/O-bound on the LLM API, so submitting them all at
+    once collapses wall time to roughly max(latency) instead of
+    sum(latency). ``asyncio.gather`` preserves input order.
+    """
+    async def _gather():
+        return await asyncio.gather(*(cached_run(agent, c) for c in commands))
+
+    return asyncio.run(_gather())
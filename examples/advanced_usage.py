@@ -1,62 +1,100 @@
 #!/usr/bin/env python3
 """Advanced usage examples for the agent demo."""
 
+import functools
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add src to path (guarded: a repeat insert at position 0 would
+# invalidate sys.path_importer_cache on every example import)
+_SRC_PATH = str(Path(__file__).parent.parent / "src")
+if _SRC_PATH not in sys.path:
+    sys.path.insert(0, _SRC_PATH)
 
 from main import create_agent
+from _cache import cached_run_sync, warm
+
+
+# Static command lists, hoisted to immutable module-level tuples so they
+# are built once and can be pre-embedded into the semantic cache.
+_PROJECT_CMDS = (
+    "Create a new directory called 'my_project'",
+    "Create a Python file 'my_project/main.py' with a simple hello world function",
+    "Create a requirements.txt file in 'my_project' with common dependencies",
+    "Create a README.md file in 'my_project' with project description",
+    "List the contents of 'my_project' directory",
+)
+
+_MAC_CMDS = (
+    "Get detailed Mac system information",
+    "List installed applications",
+    "Check if Homebrew is installed and list packages",
+    "Get Mac permission status",
+    "Create a desktop shortcut for a script",
+)
+
+_DATA_CMDS = (
+    "Create a Python script that reads a CSV file and calculates basic statistics",
+    "Create a sample CSV file with some data",
+    "Create a script that processes JSON data and extracts specific fields",
+)
+
+_SCRAPING_CMDS = (
+    "Create a Python script that uses requests and BeautifulSoup to scrape a website",
+    "Create a requirements.txt file with web scraping dependencies",
+    "Create a configuration file for web scraping settings",
+)
+
+_ALL_PROMPTS = (*_PROJECT_CMDS, *_MAC_CMDS, *_DATA_CMDS, *_SCRAPING_CMDS)
+
+# Pre-embed the static prompts in one batch so first-run semantic-cache
+# lookups don't pay per-prompt encoding cost (no-op without embeddings).
+warm(_ALL_PROMPTS)
+
+
+@functools.lru_cache(maxsize=1)
+def _agent():
+    """Create the agent once and reuse it across example functions."""
+    return create_agent()
+
+
+def _run_batched(agent, commands):
+    """Run a list of related commands as one multi-step prompt.
+
+    Each separate run_sync call pays full LLM latency; batching lets the
+    agent plan and emit all tool calls in a single generation.
+    """
+    numbered = "\n".join(f"{i}. {cmd}" for i, cmd in enumerate(commands, 1))
+    return cached_run_sync(agent, f"Perform these steps in order:\n{numbered}")
 
 
 def example_project_setup():
     """Example of setting up a new project."""
     print("=== Project Setup Example ===")
     
-    agent = create_agent()
+    agent = _agent()
     
     # Create a new project structure
-    commands = [
-        "Create a new directory called 'my_project'",
-        "Create a Python file 'my_project/main.py' with a simple hello world function",
-        "Create a requirements.txt file in 'my_project' with common dependencies",
-        "Create a README.md file in 'my_project' with project description",
-        "List the contents of 'my_project' directory"
-    ]
-    
-    for cmd in commands:
-        print(f"\nExecuting: {cmd}")
-        result = agent.run_sync(cmd)
-        print(f"Result: {result.output}")
+    result = _run_batched(agent, _PROJECT_CMDS)
+    print(f"\nResult: {result.output}")
 
 
 def example_mac_specific_operations():
     """Example of Mac-specific operations."""
     print("\n=== Mac-Specific Operations Example ===")
     
-    agent = create_agent()
+    agent = _agent()
     
     # Get Mac-specific information
-    commands = [
-        "Get detailed Mac system information",
-        "List installed applications",
-        "Check if Homebrew is installed and list packages",
-        "Get Mac permission status",
-        "Create a desktop shortcut for a script"
-    ]
-    
-    for cmd in commands:
-        print(f"\nExecuting: {cmd}")
-        result = agent.run_sync(cmd)
-        print(f"Result: {result.output}")
+    result = _run_batched(agent, _MAC_CMDS)
+    print(f"\nResult: {result.output}")
 
 
 def example_automation_script():
     """Example of creating an automation script."""
     print("\n=== Automation Script Example ===")
     
-    agent = create_agent()
+    agent = _agent()
     
     # Create an automation script
     script_content = '''
@@ -82,7 +120,7 @@ if __name__ == "__main__":
     cleanup_temp_files()
 '''
     
-    result = agent.run_sync(f"Create a Python file 'cleanup.py' with this content: {script_content}")
+    result = cached_run_sync(agent, f"Create a Python file 'cleanup.py' with this content: {script_content}")
     print("Automation script creation:", result.output)
 
 
@@ -90,38 +128,22 @@ def example_data_processing():
     """Example of data processing tasks."""
     print("\n=== Data Processing Example ===")
     
-    agent = create_agent()
+    agent = _agent()
     
     # Create a data processing script
-    commands = [
-        "Create a Python script that reads a CSV file and calculates basic statistics",
-        "Create a sample CSV file with some data",
-        "Create a script that processes JSON data and extracts specific fields"
-    ]
-    
-    for cmd in commands:
-        print(f"\nExecuting: {cmd}")
-        result = agent.run_sync(cmd)
-        print(f"Result: {result.output}")
+    result = _run_batched(agent, _DATA_CMDS)
+    print(f"\nResult: {result.output}")
 
 
 def example_web_scraping():
     """Example of web scraping setup."""
     print("\n=== Web Scraping Example ===")
     
-    agent = create_agent()
+    agent = _agent()
     
     # Create a web scraping script
-    commands = [
-        "Create a Python script that uses requests and BeautifulSoup to scrape a website",
-        "Create a requirements.txt file with web scraping dependencies",
-        "Create a configuration file for web scraping settings"
-    ]
-    
-    for cmd in commands:
-        print(f"\nExecuting: {cmd}")
-        result = agent.run_sync(cmd)
-        print(f"Result: {result.output}")
+    result = _run_batched(agent, _SCRAPING_CMDS)
+    print(f"\nResult: {result.output}")
 
 
 if __name__ == "__main__":
@@ -1,75 +1,136 @@
 #!/usr/bin/env python3
 """Basic usage examples for the agent demo."""
 
+import asyncio
+import functools
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add src to path (guarded: a repeat insert at position 0 would
+# invalidate sys.path_importer_cache on every example import)
+_SRC_PATH = str(Path(__file__).parent.parent / "src")
+if _SRC_PATH not in sys.path:
+    sys.path.insert(0, _SRC_PATH)
 
 from main import create_agent
+from _cache import cached_run, cached_run_sync
+
+
+@functools.lru_cache(maxsize=1)
+def _agent():
+    """Create the agent once and reuse it across example functions."""
+    return create_agent()
 
 
 def example_file_operations():
     """Example of file operations."""
-    print("=== File Operations Example ===")
-    
-    agent = create_agent()
+    agent = _agent()
+    lines = ["=== File Operations Example ==="]
     
     # Create a Python file
-    result = agent.run_sync("Create a Python script called 'hello.py' that prints 'Hello, World!'")
-    print("Create Python file:", result.output)
+    result = cached_run_sync(agent, "Create a Python script called 'hello.py' that prints 'Hello, World!'")
+    lines.append(f"Create Python file: {result.output}")
     
     # List files
-    result = agent.run_sync("List all Python files in the current directory")
-    print("List Python files:", result.output)
+    result = cached_run_sync(agent, "List all Python files in the current directory")
+    lines.append(f"List Python files: {result.output}")
+    
+    # One buffered write instead of a syscall per print
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def example_system_info():
     """Example of system information gathering."""
-    print("\n=== System Information Example ===")
-    
-    agent = create_agent()
+    agent = _agent()
+    lines = ["\n=== System Information Example ==="]
     
     # Get system info
-    result = agent.run_sync("Get detailed system information")
-    print("System info:", result.output)
+    result = cached_run_sync(agent, "Get detailed system information")
+    lines.append(f"System info: {result.output}")
     
     # Get Mac-specific info
-    result = agent.run_sync("Get Mac system information including macOS version")
-    print("Mac info:", result.output)
+    result = cached_run_sync(agent, "Get Mac system information including macOS version")
+    lines.append(f"Mac info: {result.output}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def example_command_execution():
     """Example of command execution."""
-    print("\n=== Command Execution Example ===")
-    
-    agent = create_agent()
+    agent = _agent()
     
     # Execute a simple command
-    result = agent.run_sync("Execute the command 'ls -la' to list files")
-    print("Command execution:", result.output)
+    result = cached_run_sync(agent, "Execute the command 'ls -la' to list files")
+    sys.stdout.write(
+        f"\n=== Command Execution Example ===\nCommand execution: {result.output}\n"
+    )
+
+
+async def _interactive_session_async(agent):
+    """Prompt loop that overlaps the LLM round-trip with user typing.
+
+    The previous request runs as a background task while the next prompt
+    is being typed, so the HTTP latency hides behind keyboard time.
+    prompt_toolkit also provides line editing and history for free.
+    """
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.patch_stdout import patch_stdout
+
+    session = PromptSession()
+    pending = None
+
+    with patch_stdout():
+        while True:
+            try:
+                user_input = (await session.prompt_async("\n>>> ")).strip()
+            except (EOFError, KeyboardInterrupt):
+                print("\nExiting...")
+                break
+
+            if user_input.lower() in ['quit', 'exit', 'q']:
+                break
+
+            if not user_input:
+                continue
+
+            # Drain the in-flight request before dispatching the next one
+            if pending is not None:
+                print((await pending).output)
+            pending = asyncio.create_task(cached_run(agent, user_input))
+
+        if pending is not None:
+            print((await pending).output)
 
 
 def example_interactive_session():
     """Example of interactive session."""
     print("\n=== Interactive Session Example ===")
     print("Starting interactive session. Type 'quit' to exit.")
-    
-    agent = create_agent()
-    
+
+    agent = _agent()
+
+    try:
+        import prompt_toolkit  # noqa: F401
+    except ImportError:
+        prompt_toolkit = None
+
+    if prompt_toolkit is not None:
+        asyncio.run(_interactive_session_async(agent))
+        return
+
+    # Fallback: plain blocking input() loop when prompt_toolkit is absent
     while True:
         try:
             user_input = input("\n>>> ").strip()
             if user_input.lower() in ['quit', 'exit', 'q']:
                 break
-            
+
             if not user_input:
                 continue
-                
-            result = agent.run_sync(user_input)
+
+            result = cached_run_sync(agent, user_input)
             print(result.output)
-            
+
         except KeyboardInterrupt:
             print("\nExiting...")
             break
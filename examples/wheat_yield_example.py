@@ -9,13 +9,29 @@ Usage:
     python wheat_yield_example.py
 """
 
+import functools
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add src to path (guarded: a repeat insert at position 0 would
+# invalidate sys.path_importer_cache on every example import)
+_SRC_PATH = str(Path(__file__).parent.parent / "src")
+if _SRC_PATH not in sys.path:
+    sys.path.insert(0, _SRC_PATH)
+
+_MODEL_PATH = str(Path(__file__).parent.parent / "model")
+if _MODEL_PATH not in sys.path:
+    sys.path.insert(0, _MODEL_PATH)
 
 from main import create_agent
+from aquacrop_model import predict_yield
+from _cache import cached_run_sync
+
+
+@functools.lru_cache(maxsize=1)
+def _agent():
+    """Create the agent once and reuse it across example functions."""
+    return create_agent()
 
 
 def example_standalone_usage():
@@ -24,10 +40,6 @@ def example_standalone_usage():
     print("🌾 STANDALONE AQUACROP USAGE EXAMPLE")
     print("=" * 60)
     
-    # Import the standalone module
-    sys.path.insert(0, str(Path(__file__).parent.parent / "model"))
-    from aquacrop_model import predict_yield
-    
     # Example 1: Default parameters
     print("\n📊 Example 1: Default wheat yield prediction")
     print("-" * 40)
@@ -60,19 +72,19 @@ def example_agent_usage():
     print("🤖 LLM AGENT WHEAT YIELD PREDICTION EXAMPLE")
     print("=" * 60)
     
-    agent = create_agent()
+    agent = _agent()
     
     # Example 1: Simple yield prediction request
     print("\n📊 Example 1: Simple yield prediction")
     print("-" * 40)
-    result1 = agent.run_sync("Predict wheat yield for planting date 10/01")
+    result1 = cached_run_sync(agent, "Predict wheat yield for planting date 10/01")
     print("Agent Response:")
     print(result1.output)
     
     # Example 2: Detailed yield prediction with custom parameters
     print("\n📊 Example 2: Detailed yield prediction with custom parameters")
     print("-" * 40)
-    result2 = agent.run_sync(
+    result2 = cached_run_sync(agent, 
         "Predict wheat yield with planting date 11/15, soil type ClayLoam, and 4 years simulation. "
         "Show me the step-by-step process and explain what AquaCrop does."
     )
@@ -82,7 +94,7 @@ def example_agent_usage():
     # Example 3: Compare different scenarios
     print("\n📊 Example 3: Compare different scenarios")
     print("-" * 40)
-    result3 = agent.run_sync(
+    result3 = cached_run_sync(agent, 
         "Compare wheat yield predictions for different planting dates: 10/01, 11/01, and 12/01. "
         "Use the same soil type and explain the differences."
     )
@@ -96,7 +108,7 @@ def example_transparency_demo():
     print("🔍 TRANSPARENCY DEMONSTRATION")
     print("=" * 60)
     
-    agent = create_agent()
+    agent = _agent()
     
     print("\nThis example shows how the LLM agent makes the wheat yield prediction process transparent:")
     print("1. The agent explains what AquaCrop is and how it works")
@@ -104,7 +116,7 @@ def example_transparency_demo():
     print("3. The agent provides detailed results and explanations")
     print("4. Users can see exactly how the yield prediction is calculated")
     
-    result = agent.run_sync(
+    result = cached_run_sync(agent, 
         "Explain how you predict wheat yield. What is AquaCrop and how does it work? "
         "Show me a complete example with all the steps visible."
     )
@@ -118,12 +130,12 @@ def example_error_handling():
     print("⚠️  ERROR HANDLING DEMONSTRATION")
     print("=" * 60)
     
-    agent = create_agent()
+    agent = _agent()
     
     print("\nThis example shows how the system handles errors gracefully:")
     
     # Test with invalid parameters
-    result = agent.run_sync(
+    result = cached_run_sync(agent, 
         "Predict wheat yield with invalid planting date '13/45' and explain what happens"
     )
     print("\nAgent Response:")
@@ -13,120 +13,257 @@ Example:
 """
 
 import sys
+import functools
+import hashlib
 import json
+import logging
 import os
-import subprocess
+import pickle
+import shutil
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# On-disk result cache shared across processes; see predict_yield below.
+CACHE_DIR = Path.home() / '.aquacrop_cache'
+
+# Progress output goes through a module logger with lazy %-formatting so
+# silenced calls never build the message strings. Default is WARNING;
+# the CLI (and verbose=True callers) raise it to INFO.
+log = logging.getLogger("aquacrop_model")
+log.setLevel(logging.WARNING)
+
+
+def _enable_verbose_logging():
+    """Route INFO-level progress messages to stderr (idempotent)."""
+    if not log.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        log.addHandler(handler)
+    log.setLevel(logging.INFO)
+
 # Fix for AquaCrop on macOS - ensure 'python' command is available
+_ALIAS_SET = False
+
 def setup_python_alias():
-    """Set up python alias for AquaCrop compatibility."""
+    """Set up python alias for AquaCrop compatibility.
+
+    Uses shutil.which / sys.executable instead of spawning subprocesses;
+    the previous implementation paid two fork/exec pairs on every import.
+    """
+    global _ALIAS_SET
+    if _ALIAS_SET or shutil.which('python'):
+        _ALIAS_SET = True
+        return
+
+    python3_path = sys.executable or shutil.which('python3')
+    if not python3_path:
+        return
+
+    # Create a temporary symlink in a writable directory
+    temp_dir = Path.home() / '.local' / 'bin'
+    python_link = temp_dir / 'python'
     try:
-        # Check if python command exists
-        subprocess.run(['python', '--version'], check=True, capture_output=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        # Create a temporary python alias
-        python3_path = subprocess.run(['which', 'python3'], capture_output=True, text=True).stdout.strip()
-        if python3_path:
-            # Add to PATH temporarily
-            os.environ['PATH'] = f"{os.path.dirname(python3_path)}:{os.environ.get('PATH', '')}"
-            # Create a temporary symlink in a writable directory
-            temp_dir = Path.home() / '.local' / 'bin'
-            temp_dir.mkdir(parents=True, exist_ok=True)
-            python_link = temp_dir / 'python'
-            if not python_link.exists():
-                try:
-                    python_link.symlink_to(python3_path)
-                    os.environ['PATH'] = f"{temp_dir}:{os.environ.get('PATH', '')}"
-                except (OSError, PermissionError):
-                    pass  # If we can't create symlink, continue anyway
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        if not python_link.exists():
+            python_link.symlink_to(python3_path)
+    except (OSError, PermissionError):
+        return  # If we can't create symlink, continue anyway
+
+    os.environ['PATH'] = f"{temp_dir}{os.pathsep}{os.environ.get('PATH', '')}"
+    _ALIAS_SET = True
 
 # Set up the python alias before importing AquaCrop
 setup_python_alias()
 
-def predict_yield(crop_type: str = "Wheat", 
-                 planting_date: str = "10/01", 
-                 soil_type: str = "SandyLoam", 
-                 sim_years: int = 6) -> Dict[str, Any]:
+
+def _load_backend() -> Dict[str, Any]:
+    """Resolve the AquaCrop backend (real or mock) once at import time.
+
+    Probing on every predict_yield call paid a Soil construction (which
+    loads the soil parameter tables) plus the import fallback dance per
+    invocation. The probe runs once here; callers read from _BACKEND.
+    """
+    try:
+        from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent
+        from aquacrop.utils import prepare_weather, get_filepath
+
+        # Test if AquaCrop actually works by trying to create a simple object
+        Soil(soil_type='SandyLoam')
+        print("✅ Real AquaCrop loaded successfully")
+        use_mock = False
+    except (ImportError, FileNotFoundError, OSError) as e:
+        print(f"⚠️  Real AquaCrop not available ({e}), using mock implementation for demonstration")
+        from mock_aquacrop import get_mock_aquacrop
+        mock_modules = get_mock_aquacrop()
+        AquaCropModel = mock_modules['AquaCropModel']
+        Soil = mock_modules['Soil']
+        Crop = mock_modules['Crop']
+        InitialWaterContent = mock_modules['InitialWaterContent']
+        prepare_weather = mock_modules['prepare_weather']
+        get_filepath = mock_modules['get_filepath']
+        use_mock = True
+
+    return {
+        'AquaCropModel': AquaCropModel,
+        'Soil': Soil,
+        'Crop': Crop,
+        'InitialWaterContent': InitialWaterContent,
+        'prepare_weather': prepare_weather,
+        'get_filepath': get_filepath,
+        'use_mock': use_mock,
+    }
+
+
+_BACKEND = _load_backend()
+
+
+# Setup objects reused across predict_yield calls; weather-file parsing
+# is the heaviest, and compare-scenarios runs share soil + weather.
+@functools.lru_cache(maxsize=4)
+def _weather(path: str):
+    return _BACKEND['prepare_weather'](path)
+
+
+@functools.lru_cache(maxsize=8)
+def _soil(soil_type: str):
+    return _BACKEND['Soil'](soil_type=soil_type)
+
+
+@functools.lru_cache(maxsize=32)
+def _crop(crop_type: str, planting_date: str):
+    return _BACKEND['Crop'](crop_type, planting_date=planting_date)
+
+def predict_yield(crop_type: str = "Wheat",
+                 planting_date: str = "10/01",
+                 soil_type: str = "SandyLoam",
+                 sim_years: int = 6,
+                 verbose: bool = False) -> Dict[str, Any]:
     """
     Predict crop yield using AquaCrop model with transparent process logging.
-    
+
+    Results are deterministic in the parameter tuple, so repeat calls are
+    served from a cache (in-process LRU backed by pickle files under
+    ~/.aquacrop_cache) instead of re-running the multi-year simulation.
+
     Args:
         crop_type: Type of crop (default: "Wheat")
         planting_date: Planting date in MM/DD format (default: "10/01")
         soil_type: Soil type for simulation (default: "SandyLoam")
         sim_years: Number of years to simulate (default: 6)
-    
+        verbose: Print step-by-step progress (default: False); formatting
+            the DataFrame previews is pure overhead for programmatic callers
+
     Returns:
         Dictionary containing simulation results and yield predictions
     """
+    # Validate cheap-to-check inputs before paying any simulation setup;
+    # e.g. Crop('13/45') constructs fine and only crashes inside run_model
+    if sim_years < 1:
+        return {"status": "error", "error": f"sim_years must be >= 1, got {sim_years}"}
     try:
-        # Try to import real AquaCrop modules
-        use_mock = False
+        mm, dd = map(int, planting_date.split('/'))
+        if not (1 <= mm <= 12 and 1 <= dd <= 31):
+            raise ValueError
+    except (ValueError, AttributeError):
+        return {
+            "status": "error",
+            "error": f"planting_date must be MM/DD, got {planting_date!r}"
+        }
+
+    key = (crop_type, planting_date, soil_type, sim_years)
+    return json.loads(_predict_yield_cached(key, verbose))
+
+
+@functools.lru_cache(maxsize=64)
+def _predict_yield_cached(args_key: tuple, verbose: bool = False) -> str:
+    """Memoized simulation keyed on the parameter tuple.
+
+    Returns the result as a JSON string so cache entries stay immutable;
+    the public wrapper decodes a fresh dict per call. Successful results
+    are also pickled under ~/.aquacrop_cache/{sha256(args)}.pkl so a
+    second process short-circuits the simulation entirely.
+    """
+    cache_file = CACHE_DIR / f"{hashlib.sha256(repr(args_key).encode()).hexdigest()}.pkl"
+    if cache_file.exists():
         try:
-            from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent
-            from aquacrop.utils import prepare_weather, get_filepath
-            import pandas as pd
-            
-            # Test if AquaCrop actually works by trying to create a simple object
-            test_soil = Soil(soil_type='SandyLoam')
-            print("✅ Real AquaCrop loaded successfully")
-        except (ImportError, FileNotFoundError, OSError) as e:
-            print(f"⚠️  Real AquaCrop not available ({e}), using mock implementation for demonstration")
-            use_mock = True
-            # Import mock implementation
-            from mock_aquacrop import get_mock_aquacrop
-            mock_modules = get_mock_aquacrop()
-            AquaCropModel = mock_modules['AquaCropModel']
-            Soil = mock_modules['Soil']
-            Crop = mock_modules['Crop']
-            InitialWaterContent = mock_modules['InitialWaterContent']
-            prepare_weather = mock_modules['prepare_weather']
-            get_filepath = mock_modules['get_filepath']
-            import pandas as pd
-        
-        print(f"🌾 Starting AquaCrop {crop_type} yield simulation...")
-        print(f"📅 Planting date: {planting_date}")
-        print(f"🌱 Soil type: {soil_type}")
-        print(f"⏱️  Simulation years: {sim_years}")
-        print("-" * 50)
+            with cache_file.open('rb') as f:
+                return pickle.load(f)
+        except Exception:
+            pass  # Corrupt cache entry; fall through and recompute
+
+    crop_type, planting_date, soil_type, sim_years = args_key
+    results = _run_prediction(crop_type, planting_date, soil_type, sim_years, verbose)
+    encoded = json.dumps(results, ensure_ascii=False)
+
+    if results.get("status") == "success":
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with cache_file.open('wb') as f:
+                pickle.dump(encoded, f)
+        except Exception:
+            pass  # Cache is best-effort; never fail the prediction
+
+    return encoded
+
+
+def _run_prediction(crop_type: str,
+                    planting_date: str,
+                    soil_type: str,
+                    sim_years: int,
+                    verbose: bool = False) -> Dict[str, Any]:
+    """Run the actual AquaCrop (or mock) simulation. See predict_yield."""
+    if verbose:
+        _enable_verbose_logging()
+
+    try:
+        # Backend (real AquaCrop or mock) is resolved once at import time
+        use_mock = _BACKEND['use_mock']
+        AquaCropModel = _BACKEND['AquaCropModel']
+        InitialWaterContent = _BACKEND['InitialWaterContent']
+        get_filepath = _BACKEND['get_filepath']
+        import pandas as pd
+
+        log.info("🌾 Starting AquaCrop %s yield simulation...", crop_type)
+        log.info("📅 Planting date: %s", planting_date)
+        log.info("🌱 Soil type: %s", soil_type)
+        log.info("⏱️  Simulation years: %s", sim_years)
+        log.info("-" * 50)
         
         # Step 1: Prepare weather data
-        print("Step 1: Loading weather data from Tunis climate file")
+        log.info("Step 1: Loading weather data from Tunis climate file")
         if use_mock:
-            print("   Using mock weather data for demonstration")
-            weather_df = prepare_weather('mock_tunis_climate.txt')
+            log.info("   Using mock weather data for demonstration")
+            weather_df = _weather('mock_tunis_climate.txt')
         else:
             weather_file_path = get_filepath('tunis_climate.txt')
-            weather_df = prepare_weather(weather_file_path)
-        print("✅ Weather data loaded successfully")
+            weather_df = _weather(weather_file_path)
+        log.info("✅ Weather data loaded successfully")
         
         # Step 2: Set up simulation parameters
-        print("\nStep 2: Setting up simulation parameters")
+        log.info("\nStep 2: Setting up simulation parameters")
         start_year = 1979
         end_year = start_year + sim_years - 1
         sim_start_time = f"{start_year}/10/01"
         sim_end_time = f"{end_year}/05/30"
-        print(f"   Simulation period: {sim_start_time} to {sim_end_time}")
+        log.info("   Simulation period: %s to %s", sim_start_time, sim_end_time)
         
         # Step 3: Initialize AquaCrop model components
-        print("\nStep 3: Initializing AquaCrop model components")
+        log.info("\nStep 3: Initializing AquaCrop model components")
         
         # Create soil object
-        soil = Soil(soil_type=soil_type)
-        print(f"   ✅ Soil created: {soil_type}")
+        soil = _soil(soil_type)
+        log.info("   ✅ Soil created: %s", soil_type)
         
         # Create crop object
-        crop = Crop(crop_type, planting_date=planting_date)
-        print(f"   ✅ Crop created: {crop_type} with planting date {planting_date}")
+        crop = _crop(crop_type, planting_date)
+        log.info("   ✅ Crop created: %s with planting date %s", crop_type, planting_date)
         
         # Set initial water content
         initial_water_content = InitialWaterContent(value=['FC'])
-        print("   ✅ Initial water content set to Field Capacity (FC)")
+        log.info("   ✅ Initial water content set to Field Capacity (FC)")
         
         # Step 4: Create and configure model
-        print("\nStep 4: Creating AquaCrop model")
+        log.info("\nStep 4: Creating AquaCrop model")
         model = AquaCropModel(
             sim_start_time=sim_start_time,
             sim_end_time=sim_end_time,
@@ -135,63 +272,62 @@ def predict_yield(crop_type: str = "Wheat",
             crop=crop,
             initial_water_content=initial_water_content,
         )
-        print("   ✅ Model created successfully")
+        log.info("   ✅ Model created successfully")
         
         # Step 5: Run simulation
-        print("\nStep 5: Running crop simulation...")
-        print("   This may take a moment...")
+        log.info("\nStep 5: Running crop simulation...")
+        log.info("   This may take a moment...")
         model.run_model(till_termination=True)
-        print("   ✅ Simulation completed successfully")
+        log.info("   ✅ Simulation completed successfully")
         
         # Step 6: Extract results
-        print("\nStep 6: Extracting simulation results")
+        log.info("\nStep 6: Extracting simulation results")
         results = model.get_simulation_results()
         
         # Debug: Print information about the results
-        print(f"   Results shape: {results.shape}")
-        print(f"   Results columns: {list(results.columns)}")
+        log.info("   Results shape: %s", results.shape)
+        log.info("   Results columns: %s", list(results.columns))
         if not results.empty:
-            print(f"   First few rows:")
-            print(results.head())
+            if log.isEnabledFor(logging.INFO):
+                # head() repr formats every cell; skip it when silenced
+                log.info("   First few rows:\n%s", results.head())
         else:
-            print("   Results DataFrame is empty!")
+            log.info("   Results DataFrame is empty!")
         
         # Calculate yield metrics from the actual results
         yield_metrics = {}
         
-        # Check for different possible yield column names
-        yield_column = None
+        # Check for different possible yield column names (priority order);
+        # intersect against a set to avoid repeated Index lookups
         possible_yield_columns = ['Dry yield (tonne/ha)', 'Yield (tonne/ha)', 'Yield', 'yield', 'Biomass (tonne/ha)', 'Biomass']
-        
-        for col in possible_yield_columns:
-            if col in results.columns:
-                yield_column = col
-                print(f"   Found yield column: {yield_column}")
-                break
+        result_columns = set(results.columns)
+        yield_column = next((c for c in possible_yield_columns if c in result_columns), None)
+        if yield_column:
+            log.info("   Found yield column: %s", yield_column)
         
         if not results.empty and yield_column:
-            # Calculate basic yield statistics
-            total_yield = results[yield_column].sum()
-            avg_yield = results[yield_column].mean()
-            max_yield = results[yield_column].max()
-            min_yield = results[yield_column].min()
-            final_yield = results[yield_column].iloc[-1] if not results.empty else 0
-            
+            # Calculate basic yield statistics in one pass over the column
+            stats = results[yield_column].agg(['sum', 'mean', 'max', 'min'])
+            total_yield = stats['sum']
+            avg_yield = stats['mean']
+            max_yield = stats['max']
+            min_yield = stats['min']
+            final_yield = results[yield_column].iat[-1]
+
             # Calculate seasonal yields (harvest periods)
             seasonal_yields = []
             if 'Season' in results.columns and 'Harvest Date (YYYY/MM/DD)' in results.columns:
-                # Get unique seasons and their yields
-                for season in results['Season'].unique():
-                    if pd.notna(season):
-                        season_data = results[results['Season'] == season]
-                        if not season_data.empty and yield_column in season_data.columns:
-                            season_yield = season_data[yield_column].iloc[-1]  # Last value in season
-                            harvest_date = season_data['Harvest Date (YYYY/MM/DD)'].iloc[-1] if 'Harvest Date (YYYY/MM/DD)' in season_data.columns else "Unknown"
-                            seasonal_yields.append({
-                                'season': int(season),
-                                'harvest_date': str(harvest_date),
-                                'yield_tonne_per_ha': round(season_yield, 2)
-                            })
+                # One grouped pass instead of a boolean-mask scan per season
+                last_per_season = (results[results['Season'].notna()]
+                    .groupby('Season', sort=True)
+                    .agg(yield_=(yield_column, 'last'),
+                         harvest=('Harvest Date (YYYY/MM/DD)', 'last')))
+                for season, row in last_per_season.iterrows():
+                    seasonal_yields.append({
+                        'season': int(season),
+                        'harvest_date': str(row.harvest),
+                        'yield_tonne_per_ha': round(row.yield_, 2)
+                    })
             
             yield_metrics = {
                 "total_yield_tonne_per_ha": round(total_yield, 2),
@@ -202,17 +338,17 @@ def predict_yield(crop_type: str = "Wheat",
                 "seasonal_yields": seasonal_yields
             }
             
-            print(f"\n🎯 YIELD PREDICTION RESULTS:")
-            print(f"   Final Yield: {final_yield:.2f} tonne/ha")
-            print(f"   Average Yield: {avg_yield:.2f} tonne/ha")
-            print(f"   Maximum Yield: {max_yield:.2f} tonne/ha")
-            print(f"   Minimum Yield: {min_yield:.2f} tonne/ha")
-            print(f"   Total Yield: {total_yield:.2f} tonne/ha")
+            log.info("\n🎯 YIELD PREDICTION RESULTS:")
+            log.info("   Final Yield: %.2f tonne/ha", final_yield)
+            log.info("   Average Yield: %.2f tonne/ha", avg_yield)
+            log.info("   Maximum Yield: %.2f tonne/ha", max_yield)
+            log.info("   Minimum Yield: %.2f tonne/ha", min_yield)
+            log.info("   Total Yield: %.2f tonne/ha", total_yield)
             
             if seasonal_yields:
-                print(f"\n📅 SEASONAL YIELD BREAKDOWN:")
+                log.info("\n📅 SEASONAL YIELD BREAKDOWN:")
                 for season_data in seasonal_yields:
-                    print(f"   Season {season_data['season']}: {season_data['yield_tonne_per_ha']} tonne/ha (Harvest: {season_data['harvest_date']})")
+                    log.info("   Season %s: %s tonne/ha (Harvest: %s)", season_data['season'], season_data['yield_tonne_per_ha'], season_data['harvest_date'])
             
         else:
             error_msg = "No yield data found in simulation results"
@@ -230,8 +366,16 @@ def predict_yield(crop_type: str = "Wheat",
                 "final_yield_tonne_per_ha": 0,
                 "seasonal_yields": []
             }
-            print(f"❌ {error_msg}")
+            log.error("❌ %s", error_msg)
         
+        # Results are chronologically ordered, so the date range is the
+        # first/last element rather than a full min()/max() scan
+        if not results.empty and 'Date' in results.columns:
+            date_start = str(results['Date'].iat[0])
+            date_end = str(results['Date'].iat[-1])
+        else:
+            date_start = date_end = None
+
         # Prepare comprehensive results
         simulation_results = {
             "status": "success",
@@ -263,8 +407,8 @@ def predict_yield(crop_type: str = "Wheat",
                 "total_records": len(results) if not results.empty else 0,
                 "columns": list(results.columns) if not results.empty else [],
                 "date_range": {
-                    "start": str(results['Date'].min()) if not results.empty and 'Date' in results.columns else None,
-                    "end": str(results['Date'].max()) if not results.empty and 'Date' in results.columns else None
+                    "start": date_start,
+                    "end": date_end
                 }
             }
         }
@@ -273,7 +417,7 @@ def predict_yield(crop_type: str = "Wheat",
         
     except ImportError as e:
         error_msg = f"AquaCrop library not installed: {str(e)}"
-        print(f"❌ {error_msg}")
+        log.error("❌ %s", error_msg)
         return {
             "status": "error",
             "error": error_msg,
@@ -282,7 +426,7 @@ def predict_yield(crop_type: str = "Wheat",
     
     except Exception as e:
         error_msg = f"Yield prediction failed: {str(e)}"
-        print(f"❌ {error_msg}")
+        log.error("❌ %s", error_msg)
         return {
             "status": "error",
             "error": error_msg
@@ -301,15 +445,24 @@ def main():
     print("🌾 AQUACROP WHEAT YIELD PREDICTION TOOL - ENHANCED")
     print("=" * 60)
     
-    # Run prediction
-    results = predict_yield(crop_type, planting_date, soil_type, sim_years)
+    # Run prediction (CLI usage keeps the step-by-step progress output)
+    results = predict_yield(crop_type, planting_date, soil_type, sim_years, verbose=True)
     
     # Print JSON output for programmatic use
     print("\n" + "=" * 60)
     print("📊 DETAILED RESULTS (JSON):")
     print("=" * 60)
-    print(json.dumps(results, indent=2, ensure_ascii=False))
-    
+    try:
+        # orjson serializes nested dicts in C, several times faster than
+        # stdlib json; fall back transparently when it isn't installed
+        import orjson
+        sys.stdout.buffer.write(
+            orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        sys.stdout.buffer.write(b"\n")
+    except ImportError:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+
     return results
 
 
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Guard the lazy-import baseline for the CLI entry point.
+
+Runs ``python -X importtime -c "import main"`` and fails if any of the
+heavy dependencies (pydantic_ai and the openai/httpx chain it pulls in)
+spend more than a small self-time budget during import. Importing main
+must stay cheap: history-only invocations like --clear-history should
+never pay for the LLM stack.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# Self-time budget per top-level package, in microseconds. Anything above
+# this means the module was genuinely imported, not just name-checked.
+BUDGET_US = {
+    "pydantic_ai": 10_000,
+    "openai": 10_000,
+    "httpx": 10_000,
+    "psutil": 10_000,
+}
+
+
+def main() -> int:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        capture_output=True,
+        text=True,
+        cwd=SRC_DIR,
+    )
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr)
+        return proc.returncode
+
+    # -X importtime lines: "import time: <self us> | <cumulative us> | name"
+    self_time_us = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+        except ValueError:
+            continue
+        top = parts[2].strip().split(".", 1)[0]
+        if top in BUDGET_US:
+            self_time_us[top] = self_time_us.get(top, 0) + self_us
+
+    over_budget = [
+        f"{mod}: {us} us (budget {BUDGET_US[mod]} us)"
+        for mod, us in sorted(self_time_us.items())
+        if us > BUDGET_US[mod]
+    ]
+    if over_budget:
+        print("❌ Lazy-import regression: " + "; ".join(over_budget))
+        return 1
+
+    if self_time_us:
+        seen = ", ".join(f"{mod}={us} us" for mod, us in sorted(self_time_us.items()))
+        print(f"✅ import main stays within budget ({seen})")
+    else:
+        print("✅ import main stays lazy (no heavy modules imported)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
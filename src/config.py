@@ -1,6 +1,7 @@
 """Configuration management for the agent demo."""
 
 import os
+import re
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass
@@ -70,16 +71,51 @@ def load_config() -> AgentConfig:
     )
 
 
+_env_loaded = False
+
+# One match per .env line replaces the strip/split/strip chain (five
+# intermediate strings per line); groups cover double-quoted,
+# single-quoted, and bare values with an optional trailing comment
+_ENV_LINE = re.compile(
+    r'^\s*([A-Za-z_]\w*)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s#]*))\s*(?:#.*)?$'
+)
+
+
 def load_env() -> None:
-    """Load .env from common locations (cwd, script dir, parents)."""
-    candidates: list[Path] = []
-    cwd = Path.cwd()
-    script_dir = Path(__file__).resolve().parent
-    
-    # Prefer closer files first
-    candidates.extend([cwd / ".env", script_dir / ".env"])
-    candidates.extend(p / ".env" for p in script_dir.parents)
-    candidates.extend(p / ".env" for p in cwd.parents)
+    """Load .env from common locations (cwd, script dir, parents).
+
+    Memoized: repeat calls (REPL mode, load_config) short-circuit instead
+    of re-statting every candidate directory.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+
+    # Cross-process sentinel: subprocesses inherit the parent's environ,
+    # and an already-present API key means there is nothing to search for
+    if (
+        os.environ.get("_ENV_LOADED")
+        or os.getenv("DEEPSEEK_API_KEY")
+        or os.getenv("OPENAI_API_KEY")
+    ):
+        return
+
+    # Explicit override for container/prod deployments: no search at all
+    env_file = os.environ.get("ENV_FILE")
+    if env_file:
+        candidates = [Path(env_file)]
+    else:
+        # Closer files first; dedup (cwd and script_dir usually share
+        # parents) and cap the upward walk so deep trees don't turn the
+        # search into dozens of stat calls
+        cwd = Path.cwd()
+        script_dir = Path(__file__).resolve().parent
+        candidates = list(dict.fromkeys(
+            [cwd / ".env", script_dir / ".env"]
+            + [p / ".env" for p in script_dir.parents[:4]]
+            + [p / ".env" for p in cwd.parents[:4]]
+        ))
 
     loaded_any = False
     
@@ -95,6 +131,7 @@ def load_env() -> None:
         pass
 
     if loaded_any:
+        os.environ["_ENV_LOADED"] = "1"
         return
 
     # Fallback: simple parser
@@ -104,14 +141,15 @@ def load_env() -> None:
                 continue
             with env_path.open("r", encoding="utf-8") as f:
                 for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#") or "=" not in line:
+                    m = _ENV_LINE.match(line)
+                    if m is None:
+                        continue
+                    key = m.group(1)
+                    if key in os.environ:
                         continue
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    if key and key not in os.environ:
-                        os.environ[key] = value
+                    dq, sq, bare = m.group(2), m.group(3), m.group(4)
+                    os.environ[key] = dq if dq is not None else sq if sq is not None else bare
+            os.environ["_ENV_LOADED"] = "1"
             break
         except Exception:
             continue
@@ -6,55 +6,65 @@ from pathlib import Path
 from typing import Optional
 
 
+# Shared formatter, built once instead of per setup_logging call
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+
 def setup_logging(
     level: str = "INFO",
     log_file: Optional[str] = None,
-    verbose: bool = False
+    verbose: bool = False,
+    force: bool = False
 ) -> logging.Logger:
     """Set up logging configuration.
-    
+
+    Repeat calls are no-ops unless ``force`` is given, so per-request
+    callers cannot accumulate duplicate handlers (each duplicate would
+    multiply the IO done per log record).
+
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file path
         verbose: Enable verbose output to stderr
-    
+        force: Reconfigure even if already configured
+
     Returns:
         Configured logger instance
     """
-    
+
     # Convert string level to logging constant
     numeric_level = getattr(logging, level.upper(), logging.INFO)
-    
+
     # Create logger
     logger = logging.getLogger("agent_demo")
+    if getattr(logger, '_configured', False) and not force:
+        return logger
     logger.setLevel(numeric_level)
-    
+
     # Clear existing handlers
     logger.handlers.clear()
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
+
     # Console handler (stderr)
     if verbose or level.upper() == "DEBUG":
         console_handler = logging.StreamHandler(sys.stderr)
         console_handler.setLevel(numeric_level)
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(_FORMATTER)
         logger.addHandler(console_handler)
-    
+
     # File handler
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        
+
         file_handler = logging.FileHandler(log_path)
         file_handler.setLevel(numeric_level)
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(_FORMATTER)
         logger.addHandler(file_handler)
-    
+
+    logger._configured = True
     return logger
 
 
@@ -85,8 +95,8 @@ class LoggingContext:
         self.original_handlers = logger.handlers.copy()
         
         logger.handlers.clear()
-        setup_logging(self.level, self.log_file, verbose=True)
-        
+        setup_logging(self.level, self.log_file, verbose=True, force=True)
+
         return logger
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -105,10 +115,18 @@ def log_function_call(func_name: str, args: dict, result: str = None):
         result: Function result (optional)
     """
     logger = get_logger()
-    
-    logger.debug(f"Calling {func_name} with args: {args}")
+
+    # Guard + %-formatting: skip building the message strings entirely
+    # when DEBUG records would be filtered out anyway
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
+    logger.debug("Calling %s with args: %s", func_name, args)
     if result:
-        logger.debug(f"{func_name} returned: {result[:200]}..." if len(result) > 200 else f"{func_name} returned: {result}")
+        if len(result) > 200:
+            logger.debug("%s returned: %s...", func_name, result[:200])
+        else:
+            logger.debug("%s returned: %s", func_name, result)
 
 
 def log_error(error: Exception, context: str = ""):
@@ -1,90 +1,144 @@
-import os
+import atexit
+import collections
+import functools
 import json
+import os
+import re
+import sys
 from pathlib import Path
 from typing import List, Dict, Any
-from pydantic_ai import Agent
-from pydantic_ai.providers.openai import OpenAIProvider
-# Prefer the newer Chat Completions model; fall back if unavailable
-try:
-    from pydantic_ai.models.openai import OpenAIChatModel
-except Exception:  # pragma: no cover
-    from pydantic_ai.models.openai import OpenAIModel as OpenAIChatModel
-import tools
-
-def load_env() -> None:
-    """Load .env from common locations (cwd, script dir, parents)."""
-    candidates: list[Path] = []
-    cwd = Path.cwd()
-    script_dir = Path(__file__).resolve().parent
-    # Prefer closer files first
-    candidates.extend([cwd / ".env", script_dir / ".env"])
-    candidates.extend(p / ".env" for p in script_dir.parents)
-    candidates.extend(p / ".env" for p in cwd.parents)
-
-    loaded_any = False
-    # Try python-dotenv first if available
-    try:
-        from dotenv import load_dotenv as _load
 
-        for env_path in candidates:
-            if env_path.is_file():
-                _load(env_path)
-                loaded_any = True
-                break
+from config import load_env
+
+# One DFA pass classifies a turn's topic; re.I avoids a .lower() copy
+_TOPIC_RE = re.compile(r"\b(wheat|yield|file|create|system|info)\b", re.I)
+_TOPIC_LABELS = {
+    "wheat": "Wheat yield prediction",
+    "yield": "Wheat yield prediction",
+    "file": "File operations",
+    "create": "File operations",
+    "system": "System information",
+    "info": "System information",
+}
+
+
+def _classify_topics(user_input: str) -> List[str]:
+    """Label a turn's topics in one regex pass, deduped in match order."""
+    matches = _TOPIC_RE.findall(user_input)
+    if not matches:
+        return ["General assistance"]
+    return list(dict.fromkeys(_TOPIC_LABELS[m.lower()] for m in matches))
+
+
+@functools.lru_cache(maxsize=1)
+def _token_encoder():
+    """Load the tiktoken cl100k_base encoder once, if available."""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
     except Exception:
-        pass
+        return None
 
-    if loaded_any:
-        return
 
-    # Fallback: simple parser
-    for env_path in candidates:
-        try:
-            if not env_path.is_file():
-                continue
-            with env_path.open("r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#") or "=" not in line:
-                        continue
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    if key and key not in os.environ:
-                        os.environ[key] = value
-            break
-        except Exception:
-            continue
+def _tokens_of(text: str) -> int:
+    """Count tokens in text, falling back to a ~4 chars/token estimate."""
+    enc = _token_encoder()
+    if enc is not None:
+        return len(enc.encode(text))
+    return max(1, len(text) // 4)
+
+
+# History (de)serialization runs on every turn; prefer orjson's C
+# encoder when installed, with the stdlib as the drop-in fallback.
+try:
+    import orjson
+
+    def _dumps_line(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps_line(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False) + "\n"
+
+    _loads = json.loads
 
 # Conversation history management
 class ConversationHistory:
     """Manages conversation history for the LLM agent."""
     
-    def __init__(self, history_file: str = "conversation_history.json"):
+    TAIL_SIZE = 5
+    # Token budget for replayed context; budgeting by tokens instead of
+    # interaction count keeps the replayed prefix a stable size even when
+    # individual turns vary wildly in length
+    CONTEXT_TOKEN_BUDGET = 2048
+
+    def __init__(self, history_file: str = "conversation_history.jsonl"):
         self.history_file = Path(history_file)
-        self.history: List[Dict[str, Any]] = []
+        self._count = 0
+        self._tail: collections.deque = collections.deque(maxlen=self.TAIL_SIZE)
+        self._recent: collections.deque = collections.deque(maxlen=self.TAIL_SIZE)
+        self._context_cache = None
         self.load_history()
+        # One line-buffered O_APPEND handle for the process lifetime:
+        # appends skip the per-turn open/close syscall pair, and line
+        # buffering still lands each interaction on disk promptly
+        try:
+            self._fp = open(self.history_file, 'a', encoding='utf-8', buffering=1)
+            atexit.register(self._fp.close)
+        except Exception:
+            self._fp = None
     
     def load_history(self):
-        """Load conversation history from file."""
+        """Scan the history file, keeping only the recent tail in memory.
+
+        Only the last TAIL_SIZE interactions are ever used per request,
+        so the file is streamed line by line: a counter plus a bounded
+        deque of raw lines, and json.loads runs only on the tail. Memory
+        stays O(TAIL_SIZE) no matter how large the log grows. A legacy
+        .json array file is migrated to JSONL once on first load.
+        """
         try:
+            self._count = 0
+            self._tail.clear()
             if self.history_file.exists():
+                tail_lines: collections.deque = collections.deque(maxlen=self.TAIL_SIZE)
                 with open(self.history_file, 'r', encoding='utf-8') as f:
-                    self.history = json.load(f)
-                print(f"📚 Loaded {len(self.history)} previous conversations")
+                    for line in f:
+                        if line.strip():
+                            self._count += 1
+                            tail_lines.append(line)
+                self._tail.extend(_loads(line) for line in tail_lines)
+                self._recent.extend(map(self._format_block, self._tail))
+                print(f"📚 Loaded {self._count} previous conversations")
+                return
+            legacy = self.history_file.with_suffix('.json')
+            if legacy.exists():
+                with open(legacy, 'r', encoding='utf-8') as f:
+                    interactions = json.load(f)
+                with open(self.history_file, 'w', encoding='utf-8') as f:
+                    for interaction in interactions:
+                        f.write(_dumps_line(interaction))
+                legacy.unlink()
+                self._count = len(interactions)
+                self._tail.extend(interactions[-self.TAIL_SIZE:])
+                self._recent.extend(map(self._format_block, self._tail))
+                print(f"📚 Loaded {self._count} previous conversations")
             else:
                 print("📚 Starting fresh conversation history")
         except Exception as e:
             print(f"⚠️  Could not load conversation history: {e}")
-            self.history = []
-    
-    def save_history(self):
-        """Save conversation history to file."""
-        try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.history, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"⚠️  Could not save conversation history: {e}")
+            self._count = 0
+            self._tail.clear()
+            self._recent.clear()
+
+    @staticmethod
+    def _format_block(interaction: Dict[str, Any]) -> str:
+        """Render one interaction as a context block."""
+        return (
+            f"User: {interaction['user_input']}\n"
+            f"Agent: {interaction['agent_response']}\n---"
+        )
     
     def add_interaction(self, user_input: str, agent_response: str, timestamp: str = None):
         """Add a new interaction to the history."""
@@ -95,124 +149,252 @@ class ConversationHistory:
         interaction = {
             "timestamp": timestamp,
             "user_input": user_input,
-            "agent_response": agent_response
+            "agent_response": agent_response,
+            # Classified once at write time so summaries never rescan text
+            "topics": _classify_topics(user_input)
         }
-        self.history.append(interaction)
-        self.save_history()
+        self._count += 1
+        self._tail.append(interaction)
+        self._recent.append(self._format_block(interaction))
+        self._context_cache = None
+        # Append-only: one line per turn, O(1) IO regardless of history size
+        try:
+            if self._fp is not None:
+                self._fp.write(_dumps_line(interaction))
+            else:
+                with open(self.history_file, 'a', encoding='utf-8') as f:
+                    f.write(_dumps_line(interaction))
+        except Exception as e:
+            print(f"⚠️  Could not save conversation history: {e}")
     
     def get_recent_context(self, max_interactions: int = 5) -> str:
-        """Get recent conversation context for the LLM."""
-        if not self.history:
+        """Get recent conversation context for the LLM.
+
+        Blocks are pre-formatted as interactions arrive, so this is a
+        single join rather than a rebuild of every string per turn.
+        """
+        if not self._recent:
             return ""
         
-        recent = self.history[-max_interactions:]
-        context_parts = []
+        if max_interactions >= len(self._recent):
+            # Common path: the full tail. Joined once per write, not per turn.
+            if self._context_cache is None:
+                self._context_cache = "\n".join(self._recent)
+            return self._context_cache
         
-        for i, interaction in enumerate(recent):
-            context_parts.append(f"Previous interaction {i+1}:")
-            context_parts.append(f"User: {interaction['user_input']}")
-            context_parts.append(f"Agent: {interaction['agent_response']}")
-            context_parts.append("---")
-        
-        return "\n".join(context_parts)
+        return "\n".join(list(self._recent)[-max_interactions:])
     
+    def get_recent_messages(self, max_interactions: int = 5) -> List[Any]:
+        """Rebuild recent interactions as structured pydantic_ai messages.
+
+        Passing these via message_history keeps the prompt prefix stable
+        across turns (oldest-first, no renumbering), so OpenAI-compatible
+        providers can serve the shared prefix from their prompt cache
+        instead of re-billing it every turn.
+        """
+        from pydantic_ai.messages import (
+            ModelRequest,
+            ModelResponse,
+            TextPart,
+            UserPromptPart,
+        )
+
+        # Walk newest-first, keeping whole interactions until the token
+        # budget runs out; truncation always lands on a message boundary
+        selected: List[Dict[str, Any]] = []
+        budget = self.CONTEXT_TOKEN_BUDGET
+        for interaction in reversed(list(self._tail)[-max_interactions:]):
+            cost = _tokens_of(interaction['user_input']) + _tokens_of(
+                interaction['agent_response']
+            )
+            if selected and cost > budget:
+                break
+            budget -= cost
+            selected.append(interaction)
+
+        messages: List[Any] = []
+        for interaction in reversed(selected):
+            messages.append(
+                ModelRequest(parts=[UserPromptPart(content=interaction['user_input'])])
+            )
+            messages.append(
+                ModelResponse(parts=[TextPart(content=interaction['agent_response'])])
+            )
+        return messages
+
     def clear_history(self):
         """Clear all conversation history."""
-        self.history = []
-        self.save_history()
+        self._count = 0
+        self._tail.clear()
+        self._recent.clear()
+        self._context_cache = None
+        self.history_file.write_text("")
         print("🗑️  Conversation history cleared")
     
     def get_history_summary(self) -> str:
         """Get a summary of conversation history."""
-        if not self.history:
+        if not self._count:
             return "No previous conversations"
         
-        total_interactions = len(self.history)
-        recent_topics = []
+        total_interactions = self._count
+        # Dict-as-ordered-set: dedups on insert, keeps first-seen order,
+        # and drops the throwaway list + set() reshuffle at join time
+        recent_topics: Dict[str, None] = {}
         
-        # Extract recent topics (last 3 interactions)
-        for interaction in self.history[-3:]:
-            user_input = interaction['user_input'].lower()
-            if 'wheat' in user_input or 'yield' in user_input:
-                recent_topics.append("Wheat yield prediction")
-            elif 'file' in user_input or 'create' in user_input:
-                recent_topics.append("File operations")
-            elif 'system' in user_input or 'info' in user_input:
-                recent_topics.append("System information")
-            else:
-                recent_topics.append("General assistance")
+        # Tally stored topic labels (last 3 interactions); records written
+        # before labels were stored fall back to a one-off classification
+        for interaction in list(self._tail)[-3:]:
+            labels = interaction.get('topics')
+            if labels is None:
+                labels = _classify_topics(interaction['user_input'])
+            for label in labels:
+                recent_topics[label] = None
         
-        return f"Total interactions: {total_interactions}, Recent topics: {', '.join(set(recent_topics))}"
-
-# Initialize conversation history
-conversation_history = ConversationHistory()
-
-# Load config from .env
-load_env()
-api_key = os.getenv("DEEPSEEK_API_KEY") or os.getenv("OPENAI_API_KEY")
-base_url = os.getenv("DEEPSEEK_BASE_URL", "https://api.deepseek.com")
-
-if not api_key:
-    raise RuntimeError("Missing DEEPSEEK_API_KEY in .env (or OPENAI_API_KEY).")
-
-provider = OpenAIProvider(api_key=api_key, base_url=base_url)
-
-# Build model with provider so key/base_url are honored
-model = OpenAIChatModel("deepseek-chat", provider=provider)
-
-agent = Agent(
-    model,
-    instructions=(
-        "You are a MacOS script expert and interactive agent with agricultural modeling capabilities."
-        "Always confirm before performing any destructive operations."
-        "Your output should be concise, and each step should be clear and easy to follow."
-        "You can predict wheat yield using the AquaCrop model - this process is fully transparent to users."
-        "\n\nIMPORTANT: You have access to conversation history. When users ask follow-up questions or refer to previous interactions, use the conversation context to provide more relevant and personalized responses. Reference previous wheat yield predictions, file operations, or system information when appropriate."
-    ),
-    tools=[
-        tools.create_text_file,
-        tools.create_python_file,
-        tools.get_directory_structure,
-        tools.rename_file,
-        tools.execute_windows_command,
-        tools.get_host_info,
-        tools.predict_wheat_yield,
-    ],
+        return f"Total interactions: {total_interactions}, Recent topics: {', '.join(recent_topics)}"
+
+@functools.lru_cache(maxsize=1)
+def _get_history() -> ConversationHistory:
+    """Construct the conversation history on first use.
+
+    Building it eagerly at import parsed the whole history file (and
+    printed a banner) even for --help or --clear-history, which only
+    needs to truncate the file.
+    """
+    return ConversationHistory()
+
+
+# Static system instructions; one folded literal shared by every build
+_INSTRUCTIONS = (
+    "You are a MacOS script expert and interactive agent with agricultural modeling capabilities."
+    "Always confirm before performing any destructive operations."
+    "Your output should be concise, and each step should be clear and easy to follow."
+    "You can predict wheat yield using the AquaCrop model - this process is fully transparent to users."
+    "\n\nIMPORTANT: You have access to conversation history. When users ask follow-up questions or refer to previous interactions, use the conversation context to provide more relevant and personalized responses. Reference previous wheat yield predictions, file operations, or system information when appropriate."
 )
 
+
+@functools.lru_cache(maxsize=1)
+def _build_agent():
+    """Build the agent on first use.
+
+    pydantic_ai (and its pydantic/httpx/openai dependency chain) dominates
+    interpreter startup, so importing it and constructing the provider,
+    model, and Agent are deferred until a run actually needs them. History
+    maintenance paths (--clear-history, --history-summary) never pay the
+    cost — or require an API key.
+    """
+    from pydantic_ai import Agent
+    from pydantic_ai.providers.openai import OpenAIProvider
+    # Prefer the newer Chat Completions model; fall back if unavailable
+    try:
+        from pydantic_ai.models.openai import OpenAIChatModel
+    except Exception:  # pragma: no cover
+        from pydantic_ai.models.openai import OpenAIModel as OpenAIChatModel
+    import tools
+
+    # Load config from .env
+    load_env()
+    api_key = os.getenv("DEEPSEEK_API_KEY") or os.getenv("OPENAI_API_KEY")
+    base_url = os.getenv("DEEPSEEK_BASE_URL", "https://api.deepseek.com")
+
+    if not api_key:
+        raise RuntimeError("Missing DEEPSEEK_API_KEY in .env (or OPENAI_API_KEY).")
+
+    provider = OpenAIProvider(api_key=api_key, base_url=base_url)
+
+    # Build model with provider so key/base_url are honored
+    model = OpenAIChatModel("deepseek-chat", provider=provider)
+
+    return Agent(
+        model,
+        instructions=_INSTRUCTIONS,
+        tools=[
+            tools.create_text_file,
+            tools.create_python_file,
+            tools.get_directory_structure,
+            tools.rename_file,
+            tools.execute_windows_command,
+            tools.get_host_info,
+            tools.predict_wheat_yield,
+        ],
+    )
+
 def create_agent():
     """Create and return the agent instance."""
-    return agent
+    return _build_agent()
 
 def run_agent_with_history(user_input: str) -> str:
-    """Run the agent with conversation history context."""
-    # Get recent conversation context
-    context = conversation_history.get_recent_context()
-    
-    # Prepare the input with context
-    if context:
-        contextual_input = f"CONVERSATION HISTORY:\n{context}\n\nCURRENT REQUEST: {user_input}"
-    else:
-        contextual_input = user_input
+    """Run the agent with conversation history context.
+
+    History rides along as structured message_history rather than a
+    "CONVERSATION HISTORY: ..." block glued onto the user prompt — the
+    prompt itself stays byte-identical per request, which is what lets
+    the provider's prefix cache actually hit.
+    """
+    history = _get_history()
+    messages = history.get_recent_messages()
     
     # Run the agent
-    result = agent.run_sync(contextual_input)
+    result = _build_agent().run_sync(user_input, message_history=messages or None)
     response = result.output
     
     # Add to conversation history
-    conversation_history.add_interaction(user_input, response)
+    _get_history().add_interaction(user_input, response)
     
     return response
 
 def get_conversation_summary() -> str:
     """Get a summary of the conversation history."""
-    return conversation_history.get_history_summary()
+    return _get_history().get_history_summary()
 
 def clear_conversation_history():
     """Clear the conversation history."""
-    conversation_history.clear_history()
+    if _get_history.cache_info().currsize:
+        _get_history().clear_history()
+        return
+    # History never loaded this run: truncate on disk without paying
+    # for a parse of the existing file
+    Path("conversation_history.jsonl").write_text("")
+    Path("conversation_history.json").unlink(missing_ok=True)
+    print("🗑️  Conversation history cleared")
+
+_REPL_BANNER = (
+    "🤖 Entering REPL with conversation history. Press Ctrl+C to exit.\n"
+    "💡 Special commands: 'clear history', 'show history', 'help'\n"
+)
+
+_HELP = (
+    "💡 Available commands:\n"
+    "  - 'clear history' or 'clear': Clear conversation history\n"
+    "  - 'show history' or 'history': Show conversation summary\n"
+    "  - 'help' or '?': Show this help\n"
+    "  - Any other text: Send to AI agent with conversation context\n"
+)
+
+_USAGE = (
+    "usage: main.py [-h] [--repl] [--clear-history] [--history-summary] "
+    "[prompt ...]\n\n"
+    "DeepSeek agent CLI with conversation history\n\n"
+    "  prompt             prompt to send to the agent\n"
+    "  --repl             enter interactive REPL mode\n"
+    "  --clear-history    clear conversation history\n"
+    "  --history-summary  show conversation history summary\n"
+)
 
 if __name__ == "__main__":
+    # Fast paths first: these subcommands need only a string compare, so
+    # skip argparse construction (and its ~ms of startup) entirely
+    argv = sys.argv[1:]
+    if argv in (["--clear-history"], ["clear"]):
+        clear_conversation_history()
+        sys.exit(0)
+    if argv in (["--history-summary"], ["history"]):
+        print(get_conversation_summary())
+        sys.exit(0)
+    if argv in (["--help"], ["-h"]):
+        sys.stdout.write(_USAGE)
+        sys.exit(0)
+
     import argparse
 
     parser = argparse.ArgumentParser(description="DeepSeek agent CLI with conversation history")
@@ -232,8 +414,8 @@ if __name__ == "__main__":
         exit(0)
 
     if args.repl:
-        print("🤖 Entering REPL with conversation history. Press Ctrl+C to exit.")
-        print("💡 Special commands: 'clear history', 'show history', 'help'")
+        # Pre-joined constants: one write syscall instead of one per line
+        sys.stdout.write(_REPL_BANNER)
         try:
             while True:
                 try:
@@ -251,11 +433,7 @@ if __name__ == "__main__":
                     print(get_conversation_summary())
                     continue
                 elif user_in.lower() in ['help', '?']:
-                    print("💡 Available commands:")
-                    print("  - 'clear history' or 'clear': Clear conversation history")
-                    print("  - 'show history' or 'history': Show conversation summary")
-                    print("  - 'help' or '?': Show this help")
-                    print("  - Any other text: Send to AI agent with conversation context")
+                    sys.stdout.write(_HELP)
                     continue
                 
                 # Run with history
@@ -1,24 +1,92 @@
+import collections
+import errno
+import fnmatch
+import functools
+import io
 import json
+import mmap
 import os
 import platform
+import re
+import shlex
+import shutil
+import stat as statmod
 import subprocess
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
-import psutil
 from logger import get_logger, log_function_call, log_error
 
+# One getLogger dict lookup at import instead of one per tool call
+_logger = get_logger()
+
+# Tool outputs (directory trees, file listings) can be large; use
+# orjson's C encoder for the pretty-printed payloads when available.
+try:
+    import orjson
+
+    def _dumps(payload: Dict[str, Any]) -> str:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(payload: Dict[str, Any]) -> str:
+        # check_circular=False skips the seen-object bookkeeping per
+        # container; tool payloads are trees built right here, never
+        # self-referential
+        return json.dumps(
+            payload, ensure_ascii=False, indent=2, check_circular=False
+        )
+
+# The OS cannot change mid-process; answer platform.system()'s uname()
+# call once at import (same pattern as mac_tools._IS_MAC)
+_PLATFORM = platform.system()
+_IS_WINDOWS = _PLATFORM.lower() == "windows"
+
+@functools.lru_cache(maxsize=1)
+def _psutil():
+    """Import psutil on first use, priming its CPU-percent baseline.
+
+    The C-extension import costs tens of ms, which file-only tool usage
+    should not pay; the prime makes later interval=None reads report
+    usage since first use instead of 0.0.
+    """
+    import psutil
+    psutil.cpu_percent(interval=None)
+    return psutil
+
 
 def _ok(message: str, **extra: Any) -> str:
+    # Message-only responses fill a template: no dict build, no encoder
+    # walk, just one string escape (output matches the indent-2 form)
+    if not extra:
+        return '{\n  "status": "ok",\n  "message": %s\n}' % (
+            json.dumps(message, ensure_ascii=False)
+        )
     payload: Dict[str, Any] = {"status": "ok", "message": message}
     payload.update(extra)
-    return json.dumps(payload, ensure_ascii=False, indent=2)
+    return _dumps(payload)
 
 
 def _err(message: str, **extra: Any) -> str:
+    if not extra:
+        return '{\n  "status": "error",\n  "message": %s\n}' % (
+            json.dumps(message, ensure_ascii=False)
+        )
     payload: Dict[str, Any] = {"status": "error", "message": message}
     payload.update(extra)
-    return json.dumps(payload, ensure_ascii=False, indent=2)
+    return _dumps(payload)
+
+
+def _ensure_parent(file_path: str) -> None:
+    """Create the parent directory of file_path if it is missing.
+
+    The common case is an existing parent, where one isdir stat beats
+    makedirs walking every path component before concluding exist_ok.
+    """
+    parent = os.path.dirname(file_path)
+    if parent and not os.path.isdir(parent):
+        os.makedirs(parent, exist_ok=True)
 
 
 def create_text_file(file_path: str, content: str) -> str:
@@ -30,16 +98,18 @@ def create_text_file(file_path: str, content: str) -> str:
 
     Returns a JSON string indicating status and path.
     """
-    logger = get_logger()
     log_function_call("create_text_file", {"file_path": file_path, "content_length": len(content)})
     
     try:
-        path = Path(file_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding="utf-8")
-        
-        logger.info(f"Created text file: {path}")
-        return _ok("text file written", path=str(path.resolve()))
+        # Plain string ops: Path construction costs ~10x the equivalent
+        # os.path calls in these one-shot helpers
+        _ensure_parent(file_path)
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        
+        # %-style args defer formatting to the handler check
+        _logger.info("Created text file: %s", file_path)
+        return _ok("text file written", path=os.path.abspath(file_path))
     except Exception as e:
         log_error(e, f"create_text_file({file_path})")
         return _err("failed to write text file", error=str(e), path=file_path)
@@ -51,16 +121,121 @@ def create_python_file(file_path: str, code: str) -> str:
     If the path has no `.py` suffix, it will be added.
     """
     try:
-        path = Path(file_path)
-        if path.suffix != ".py":
-            path = path.with_suffix(".py")
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(code, encoding="utf-8")
-        return _ok("python file written", path=str(path.resolve()))
+        base, ext = os.path.splitext(file_path)
+        if ext != ".py":
+            file_path = base + ".py"
+        _ensure_parent(file_path)
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(code)
+        return _ok("python file written", path=os.path.abspath(file_path))
     except Exception as e:
         return _err("failed to write python file", error=str(e), path=file_path)
 
 
+# Common noisy directories, skipped when building structure trees.
+# Overridable with a comma-separated AGENT_SKIP_DIRS environment variable.
+_DEFAULT_SKIP_DIRS = (
+    ".git", "__pycache__", "node_modules",
+    ".venv", "venv", ".mypy_cache", ".pytest_cache",
+)
+_SKIP_DIRS: frozenset = frozenset(
+    name.strip()
+    for name in os.environ.get(
+        "AGENT_SKIP_DIRS", ",".join(_DEFAULT_SKIP_DIRS)
+    ).split(",")
+    if name.strip()
+)
+
+# Agents tend to re-inspect the same roots; walk results are cached
+# keyed on the root's mtime plus a coarse time bucket, so edits to the
+# root invalidate immediately and nested-only edits age out within a
+# minute. LRU-bounded, and a changed key simply evicts the old entry.
+_WALK_CACHE_TTL_SEC = 60
+
+
+def _ttl_bucket() -> int:
+    return int(time.monotonic() // _WALK_CACHE_TTL_SEC)
+
+
+def _collect_entries(path_str: str):
+    """Scan one directory, returning sorted (name, path, is_dir) tuples."""
+    try:
+        with os.scandir(path_str) as it:
+            entries = [
+                (entry.name, entry.path, entry.is_dir(follow_symlinks=False))
+                for entry in it
+                if entry.name not in _SKIP_DIRS
+            ]
+    except PermissionError:
+        entries = []
+    entries.sort(key=lambda item: (not item[2], item[0].lower()))
+    return path_str, entries
+
+
+def _scan_tree(root: str) -> Dict[str, list]:
+    """Scan a whole tree breadth-first with a thread pool.
+
+    getdents blocks in the kernel with the GIL released, so scanning the
+    directories of each level concurrently overlaps the waits — the win
+    grows with fanout and is largest on network filesystems.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    listing: Dict[str, list] = {}
+    frontier = [root]
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        while frontier:
+            next_frontier: List[str] = []
+            for path_str, entries in ex.map(_collect_entries, frontier):
+                listing[path_str] = entries
+                next_frontier.extend(
+                    path for _, path, is_dir in entries if is_dir
+                )
+            frontier = next_frontier
+    return listing
+
+
+def _emit_dir(out: io.StringIO, path_str: str, name: str, listing: Dict[str, list]) -> None:
+    """Stream the tree rooted at path_str as JSON from the pre-scanned listing.
+
+    Encoding during assembly keeps the serialized copy as the only
+    full-size buffer; only name/path strings go through the json scalar
+    encoder. The explicit frame stack (child iterator + comma flag per
+    open directory) replaces call recursion, so depth is bounded by
+    memory rather than the interpreter recursion limit.
+    """
+    dumps = json.dumps
+    out.write('{"type": "dir", "name": %s, "path": %s, "children": [' % (
+        dumps(name, ensure_ascii=False),
+        dumps(path_str, ensure_ascii=False),
+    ))
+    frames = [iter(listing.get(path_str, ()))]
+    first = [True]
+    while frames:
+        entry = next(frames[-1], None)
+        if entry is None:
+            out.write("]}")
+            frames.pop()
+            first.pop()
+            continue
+        child_name, child_path, is_dir = entry
+        if not first[-1]:
+            out.write(", ")
+        first[-1] = False
+        if is_dir:
+            out.write('{"type": "dir", "name": %s, "path": %s, "children": [' % (
+                dumps(child_name, ensure_ascii=False),
+                dumps(child_path, ensure_ascii=False),
+            ))
+            frames.append(iter(listing.get(child_path, ())))
+            first.append(True)
+        else:
+            out.write('{"type": "file", "name": %s, "path": %s}' % (
+                dumps(child_name, ensure_ascii=False),
+                dumps(child_path, ensure_ascii=False),
+            ))
+
+
 def get_directory_structure(root: str = ".") -> str:
     """Return a JSON tree of the directory structure.
 
@@ -71,157 +246,317 @@ def get_directory_structure(root: str = ".") -> str:
     if not root_path.exists():
         return _err("root does not exist", root=str(root_path))
 
-    def walk(p: Path) -> Dict[str, Any]:
-        if p.is_dir():
-            children: List[Dict[str, Any]] = []
-            for child in sorted(p.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower())):
-                # Skip common noisy directories
-                if child.name in {".git", "__pycache__", "node_modules"}:
-                    continue
-                children.append(walk(child))
-            return {"type": "dir", "name": p.name, "path": str(p), "children": children}
-        else:
-            return {"type": "file", "name": p.name, "path": str(p)}
-
     try:
-        tree = walk(root_path)
-        return json.dumps(tree, ensure_ascii=False, indent=2)
+        if not root_path.is_dir():
+            tree: Dict[str, Any] = {
+                "type": "file", "name": root_path.name, "path": str(root_path)
+            }
+            return _dumps(tree)
+
+        st = os.stat(root_path)
+        return _tree_cached(str(root_path), root_path.name, st.st_mtime_ns, _ttl_bucket())
     except Exception as e:
         return _err("failed to build structure", error=str(e), root=str(root_path))
 
 
+@functools.lru_cache(maxsize=128)
+def _tree_cached(path_str: str, name: str, mtime_ns: int, ttl_bucket: int) -> str:
+    listing = _scan_tree(path_str)
+    out = io.StringIO()
+    _emit_dir(out, path_str, name, listing)
+    return out.getvalue()
+
+
 def rename_file(old_path: str, new_path: str) -> str:
     """Rename or move a file or directory."""
     try:
-        src = Path(old_path)
-        dst = Path(new_path)
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        src.rename(dst)
-        return _ok("renamed", src=str(src), dst=str(dst))
+        _ensure_parent(new_path)
+        try:
+            # Atomic rename, overwriting an existing target in one syscall
+            os.replace(old_path, new_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Cross-filesystem move (e.g. /tmp -> workdir): copy + unlink
+            shutil.move(old_path, new_path)
+        return _ok("renamed", src=old_path, dst=new_path)
     except Exception as e:
         return _err("failed to rename", error=str(e), src=old_path, dst=new_path)
 
 
-def execute_command(command: str, timeout_sec: int = 60) -> str:
-    """Execute a shell command and return output.
-    
-    Supports both Unix/macOS and Windows systems.
+# Per-stream capture bound for executed commands: 1 MB of head and
+# 1 MB of tail are kept; the middle of pathological outputs is dropped
+_OUTPUT_CAP_BYTES = 1 << 20
+
+# Characters whose shell meaning shlex.split would not reproduce
+# (globs, redirects, pipes, expansions, comments, assignments). Their
+# absence means the string is a plain argv and /bin/sh adds nothing.
+_SHELL_META = frozenset("|&;<>()$`\\\"'*?[]{}~#=!\n")
+
+
+def _drain_stream(stream, captured: Dict[str, str], key: str) -> None:
+    """Drain a pipe into a bounded head+tail buffer from a reader thread.
+
+    Keeps memory flat no matter how much the child writes, instead of
+    capture_output's unbounded in-memory accumulation.
     """
+    head: List[str] = []
+    head_len = 0
+    tail: collections.deque = collections.deque()
+    tail_len = 0
+    truncated = False
+    while True:
+        chunk = stream.read(65536)
+        if not chunk:
+            break
+        if head_len < _OUTPUT_CAP_BYTES:
+            head.append(chunk)
+            head_len += len(chunk)
+        else:
+            truncated = True
+            tail.append(chunk)
+            tail_len += len(chunk)
+            while tail_len > _OUTPUT_CAP_BYTES and len(tail) > 1:
+                tail_len -= len(tail.popleft())
+    text = "".join(head)
+    if truncated:
+        text += "\n…truncated…\n" + "".join(tail)
+    captured[key] = text
+
+
+def _run_command(
+    command: Union[str, List[str]], timeout_sec: int, include_platform: bool
+) -> str:
+    """Shared bounded-capture runner behind both command tools.
+
+    One implementation means the argv/shell dispatch and the head+tail
+    output capping apply uniformly, instead of being duplicated and
+    drifting between the two public functions.
+    """
+    run_target: Union[str, List[str]] = command
+    use_shell = isinstance(command, str)
+    # Metachar-free strings skip the shell: one fork+exec instead of
+    # two, and no /bin/sh parse of the command line
+    if use_shell and not _IS_WINDOWS and not _SHELL_META.intersection(command):
+        argv = shlex.split(command)
+        if argv:
+            run_target, use_shell = argv, False
     try:
-        # Use appropriate shell based on platform
-        shell_cmd = command
-        if platform.system().lower() == "windows":
-            shell_cmd = f"cmd /c {command}"
-        
-        completed = subprocess.run(
-            shell_cmd,
-            shell=True,
+        proc = subprocess.Popen(
+            run_target,
+            shell=use_shell,
             text=True,
-            capture_output=True,
-            timeout=timeout_sec,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             encoding="utf-8",
             errors="replace",
         )
-        return json.dumps(
-            {
-                "status": "ok" if completed.returncode == 0 else "error",
-                "returncode": completed.returncode,
-                "stdout": completed.stdout,
-                "stderr": completed.stderr,
-                "platform": platform.system(),
-            },
-            ensure_ascii=False,
-            indent=2,
-        )
-    except subprocess.TimeoutExpired:
-        return _err("command timed out", command=command, timeout_sec=timeout_sec)
+        captured: Dict[str, str] = {}
+        readers = [
+            threading.Thread(target=_drain_stream, args=(proc.stdout, captured, "stdout")),
+            threading.Thread(target=_drain_stream, args=(proc.stderr, captured, "stderr")),
+        ]
+        for reader in readers:
+            reader.start()
+        try:
+            returncode = proc.wait(timeout=timeout_sec)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            for reader in readers:
+                reader.join()
+            return _err("command timed out", command=command, timeout_sec=timeout_sec)
+        for reader in readers:
+            reader.join()
+        payload = {
+            "status": "ok" if returncode == 0 else "error",
+            "returncode": returncode,
+            "stdout": captured.get("stdout", ""),
+            "stderr": captured.get("stderr", ""),
+        }
+        if include_platform:
+            payload["platform"] = _PLATFORM
+        return _dumps(payload)
     except Exception as e:
         return _err("failed to execute command", error=str(e), command=command)
 
 
+def execute_command(command: Union[str, List[str]], timeout_sec: int = 60) -> str:
+    """Execute a shell command and return output.
+    
+    Supports both Unix/macOS and Windows systems. A string runs through
+    the shell as before; an argv list is executed directly, skipping the
+    /bin/sh (or ComSpec) intermediary process.
+    """
+    return _run_command(command, timeout_sec, include_platform=True)
+
+
 def execute_windows_command(command: str, timeout_sec: int = 60) -> str:
     """Execute a Windows CMD command and return output.
 
     On non-Windows systems, returns an error message.
     """
-    if platform.system().lower() != "windows":
+    if not _IS_WINDOWS:
         return _err("not running on windows", command=command)
 
-    try:
-        completed = subprocess.run(
-            command,
-            shell=True,
-            text=True,
-            capture_output=True,
-            timeout=timeout_sec,
-            encoding="utf-8",
-            errors="replace",
-        )
-        return json.dumps(
-            {
-                "status": "ok" if completed.returncode == 0 else "error",
-                "returncode": completed.returncode,
-                "stdout": completed.stdout,
-                "stderr": completed.stderr,
-            },
-            ensure_ascii=False,
-            indent=2,
-        )
-    except subprocess.TimeoutExpired:
-        return _err("command timed out", command=command, timeout_sec=timeout_sec)
-    except Exception as e:
-        return _err("failed to execute command", error=str(e), command=command)
+    return _run_command(command, timeout_sec, include_platform=False)
 
 
-def get_host_info() -> str:
-    """Get host information as a JSON string."""
+@functools.lru_cache(maxsize=1)
+def _host_info_static() -> Dict[str, Any]:
+    """Gather the host facts that cannot change within a process.
+
+    Cached because the sysctl fork/exec alone costs tens of ms and the
+    tool tends to be called repeatedly within an agent session.
+    """
     info: Dict[str, Any] = {
         "system": platform.system(),
         "release": platform.release(),
         "machine": platform.machine(),
         "processor": platform.processor(),
-        "memory_gb": round(psutil.virtual_memory().total / (1024**3), 2),
     }
 
-    cpu_count = psutil.cpu_count(logical=True)
+    cpu_count = _psutil().cpu_count(logical=True)
     info["cpu_count"] = cpu_count if cpu_count is not None else -1
 
-    # Best-effort CPU model on macOS; ignore failures on other OSes
-    try:
-        cpu_model = subprocess.check_output(
-            ["sysctl", "-n", "machdep.cpu.brand_string"]
-        ).decode().strip()
-        info["cpu_model"] = cpu_model
-    except Exception:
-        info["cpu_model"] = "Unknown"
+    # Best-effort CPU model on macOS. sysctlbyname through ctypes is one
+    # syscall where forking the sysctl binary costs a few ms; the
+    # subprocess stays as the fallback. Gated on Darwin so other OSes
+    # skip the doomed dlopen/fork entirely instead of paying for the
+    # exception path, and the fallback is time-bounded — a wedged sysctl
+    # must not stall the whole tool call.
+    info["cpu_model"] = "Unknown"
+    if _PLATFORM == "Darwin":
+        try:
+            import ctypes
+            libc = ctypes.CDLL("libc.dylib")
+            size = ctypes.c_size_t(0)
+            name = b"machdep.cpu.brand_string"
+            if libc.sysctlbyname(name, None, ctypes.byref(size), None, 0) != 0:
+                raise OSError("sysctlbyname size probe failed")
+            buf = ctypes.create_string_buffer(size.value)
+            if libc.sysctlbyname(name, buf, ctypes.byref(size), None, 0) != 0:
+                raise OSError("sysctlbyname read failed")
+            info["cpu_model"] = buf.value.decode()
+        except Exception:
+            try:
+                info["cpu_model"] = subprocess.check_output(
+                    ["sysctl", "-n", "machdep.cpu.brand_string"],
+                    stderr=subprocess.DEVNULL, timeout=1
+                ).decode().strip()
+            except Exception:
+                pass
+
+    return info
+
 
-    return json.dumps(info, ensure_ascii=False, indent=2)
+def get_host_info() -> str:
+    """Get host information as a JSON string."""
+    info = dict(_host_info_static())
+    # Total memory is the only value worth refreshing per call
+    info["memory_gb"] = round(_psutil().virtual_memory().total / (1024**3), 2)
+    return _dumps(info)
+
+
+_WILDCARD_CHARS = frozenset("*?[")
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_glob(pattern: str):
+    """Compile a glob to a regex once; re.match beats a per-entry
+    fnmatch call, which redoes its own cache lookup every time."""
+    return re.compile(fnmatch.translate(pattern))
+
+
+def _split_literal_prefix(pattern: str):
+    """Split a glob pattern into its literal leading dirs and the rest.
+
+    "src/utils/*.py" -> ("src/utils", ["*.py"]): the literal part joins
+    onto the root before scanning, so the walk never descends into
+    siblings that cannot match.
+    """
+    parts = pattern.split("/")
+    literal: List[str] = []
+    while parts and not _WILDCARD_CHARS.intersection(parts[0]):
+        literal.append(parts.pop(0))
+    return "/".join(literal), parts
+
+
+def _scan(root: str, pattern: str, recursive: bool) -> List[Dict[str, Any]]:
+    """Collect files under root matching pattern via os.scandir.
+
+    DirEntry type checks and stat() reuse the data returned by the
+    directory read itself, so the walk does no extra stat syscall per
+    entry and allocates no Path objects — unlike rglob, which stats each
+    hit again.
+    """
+    files: List[Dict[str, Any]] = []
+    match = _compile_glob(pattern).match
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif match(entry.name) and entry.is_file(
+                        follow_symlinks=False
+                    ):
+                        st = entry.stat()
+                        files.append({
+                            "name": entry.name,
+                            "path": entry.path,
+                            "size_bytes": st.st_size,
+                            "modified": st.st_mtime,
+                            "extension": os.path.splitext(entry.name)[1]
+                        })
+        except PermissionError:
+            continue
+    files.sort(key=lambda f: f["path"])
+    return files
 
 
 def list_files(directory: str = ".", pattern: str = "*", recursive: bool = True) -> str:
     """List files in a directory with optional pattern matching."""
     try:
-        dir_path = Path(directory)
-        if not dir_path.exists():
+        try:
+            st = os.stat(directory)
+        except FileNotFoundError:
             return _err("directory does not exist", directory=directory)
         
-        if recursive:
-            files = list(dir_path.rglob(pattern))
-        else:
-            files = list(dir_path.glob(pattern))
-        
-        file_list = []
-        for file_path in sorted(files):
-            if file_path.is_file():
-                stat = file_path.stat()
+        return _list_cached(directory, pattern, recursive, st.st_mtime_ns, _ttl_bucket())
+    except Exception as e:
+        return _err("failed to list files", error=str(e), directory=directory)
+
+
+@functools.lru_cache(maxsize=128)
+def _list_cached(
+    directory: str, pattern: str, recursive: bool, mtime_ns: int, ttl_bucket: int
+) -> str:
+    try:
+        base, rest = _split_literal_prefix(pattern)
+        root = os.path.join(directory, base) if base else directory
+        
+        if not rest:
+            # Fully literal pattern: one stat instead of any walk
+            file_list = []
+            if os.path.isfile(root):
+                st = os.stat(root)
+                name = os.path.basename(root)
                 file_list.append({
-                    "name": file_path.name,
-                    "path": str(file_path),
-                    "size_bytes": stat.st_size,
-                    "modified": stat.st_mtime,
-                    "extension": file_path.suffix
+                    "name": name,
+                    "path": root,
+                    "size_bytes": st.st_size,
+                    "modified": st.st_mtime,
+                    "extension": os.path.splitext(name)[1]
                 })
-        
+        elif not os.path.isdir(root):
+            file_list = []
+        else:
+            # Wildcard directory segments (e.g. "**") imply a recursive
+            # walk; the final segment is the filename pattern
+            file_list = _scan(root, rest[-1], recursive or len(rest) > 1)
         return _ok("files listed", files=file_list, count=len(file_list))
     except Exception as e:
         return _err("failed to list files", error=str(e), directory=directory)
@@ -230,19 +565,30 @@ def list_files(directory: str = ".", pattern: str = "*", recursive: bool = True)
 def read_file_content(file_path: str, max_size_mb: int = 10) -> str:
     """Read file content with size limit protection."""
     try:
-        path = Path(file_path)
-        if not path.exists():
+        # One stat answers existence, type, and size (the exists/is_file/
+        # stat Path chain cost three)
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             return _err("file does not exist", file_path=file_path)
         
-        if not path.is_file():
+        if not statmod.S_ISREG(st.st_mode):
             return _err("path is not a file", file_path=file_path)
         
-        # Check file size
-        size_mb = path.stat().st_size / (1024 * 1024)
+        size_mb = st.st_size / (1 << 20)
         if size_mb > max_size_mb:
             return _err(f"file too large ({size_mb:.1f}MB > {max_size_mb}MB)", file_path=file_path)
         
-        content = path.read_text(encoding="utf-8", errors="replace")
+        # Binary slurp + one decode: skips TextIOWrapper's incremental
+        # decoder. Files of 1 MB and up decode straight from an mmap,
+        # saving the read() copy of the raw bytes; below that the mmap
+        # setup costs more than the copy it avoids.
+        with open(file_path, "rb") as f:
+            if st.st_size >= 1 << 20:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    content = mm[:].decode("utf-8", errors="replace")
+            else:
+                content = f.read().decode("utf-8", errors="replace")
         return _ok("file read", content=content, size_mb=round(size_mb, 2))
     except Exception as e:
         return _err("failed to read file", error=str(e), file_path=file_path)
@@ -251,9 +597,8 @@ def read_file_content(file_path: str, max_size_mb: int = 10) -> str:
 def create_directory(dir_path: str) -> str:
     """Create a directory and all parent directories."""
     try:
-        path = Path(dir_path)
-        path.mkdir(parents=True, exist_ok=True)
-        return _ok("directory created", path=str(path.resolve()))
+        os.makedirs(dir_path, exist_ok=True)
+        return _ok("directory created", path=os.path.abspath(dir_path))
     except Exception as e:
         return _err("failed to create directory", error=str(e), dir_path=dir_path)
 
@@ -261,20 +606,27 @@ def create_directory(dir_path: str) -> str:
 def delete_file(file_path: str) -> str:
     """Delete a file or empty directory."""
     try:
-        path = Path(file_path)
-        if not path.exists():
+        # EAFP: one unlink syscall in the common case, with the kernel's
+        # error codes replacing the exists/isfile/isdir stat chain and
+        # the emptiness pre-scan
+        try:
+            os.unlink(file_path)
+            return _ok("file deleted", path=file_path)
+        except FileNotFoundError:
             return _err("file does not exist", file_path=file_path)
-        
-        if path.is_file():
-            path.unlink()
-            return _ok("file deleted", path=str(path))
-        elif path.is_dir():
-            if any(path.iterdir()):
-                return _err("directory is not empty", file_path=file_path)
-            path.rmdir()
-            return _ok("directory deleted", path=str(path))
-        else:
-            return _err("unknown file type", file_path=file_path)
+        except (IsADirectoryError, PermissionError):
+            # unlink on a directory raises EISDIR (EPERM/EACCES on some
+            # platforms); fall through to rmdir, which re-raises for
+            # genuine permission failures on files
+            if not os.path.isdir(file_path):
+                raise
+            try:
+                os.rmdir(file_path)
+                return _ok("directory deleted", path=file_path)
+            except OSError as e:
+                if e.errno in (errno.ENOTEMPTY, errno.EEXIST):
+                    return _err("directory is not empty", file_path=file_path)
+                raise
     except Exception as e:
         return _err("failed to delete file", error=str(e), file_path=file_path)
 
@@ -282,9 +634,16 @@ def delete_file(file_path: str) -> str:
 def get_system_resources() -> str:
     """Get current system resource usage."""
     try:
-        cpu_percent = psutil.cpu_percent(interval=1)
+        psutil = _psutil()
+        # Non-blocking: usage since the previous call (primed on first
+        # psutil use), instead of sleeping a full second inside the tool
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        # One raw statvfs syscall instead of psutil's disk_usage wrapper
+        vfs = os.statvfs('/')
+        disk_total = vfs.f_blocks * vfs.f_frsize
+        disk_free = vfs.f_bavail * vfs.f_frsize
+        disk_used = disk_total - disk_free
         
         resources = {
             "cpu_percent": cpu_percent,
@@ -294,10 +653,10 @@ def get_system_resources() -> str:
                 "used_percent": memory.percent
             },
             "disk": {
-                "total_gb": round(disk.total / (1024**3), 2),
-                "used_gb": round(disk.used / (1024**3), 2),
-                "free_gb": round(disk.free / (1024**3), 2),
-                "used_percent": round((disk.used / disk.total) * 100, 2)
+                "total_gb": round(disk_total / (1024**3), 2),
+                "used_gb": round(disk_used / (1024**3), 2),
+                "free_gb": round(disk_free / (1024**3), 2),
+                "used_percent": round((disk_used / disk_total) * 100, 2)
             }
         }
         
@@ -306,6 +665,63 @@ def get_system_resources() -> str:
         return _err("failed to get system resources", error=str(e))
 
 
+def _setup_python_alias():
+    """Ensure a `python` command exists for AquaCrop compatibility."""
+    try:
+        subprocess.run(['python', '--version'], check=True, capture_output=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        python3_path = subprocess.run(['which', 'python3'], capture_output=True, text=True).stdout.strip()
+        if python3_path:
+            os.environ['PATH'] = f"{os.path.dirname(python3_path)}:{os.environ.get('PATH', '')}"
+            temp_dir = Path.home() / '.local' / 'bin'
+            temp_dir.mkdir(parents=True, exist_ok=True)
+            python_link = temp_dir / 'python'
+            if not python_link.exists():
+                try:
+                    python_link.symlink_to(python3_path)
+                    os.environ['PATH'] = f"{temp_dir}:{os.environ.get('PATH', '')}"
+                except (OSError, PermissionError):
+                    pass
+
+
+@functools.lru_cache(maxsize=1)
+def _load_aquacrop() -> Dict[str, Any]:
+    """Resolve the AquaCrop backend (real or mock) once per process.
+
+    The import probe, the test Soil construction, and the mock fallback's
+    sys.path insert all used to run on every predict_wheat_yield call.
+    Memoized so repeat predictions pay none of it, and sys.path stops
+    growing by one entry per call.
+    """
+    logger = _logger
+    _setup_python_alias()
+    try:
+        from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent
+        from aquacrop.utils import prepare_weather, get_filepath
+        # Test if AquaCrop actually works by trying to create a simple object
+        Soil(soil_type='SandyLoam')
+        logger.info("Real AquaCrop loaded successfully")
+        return {
+            'AquaCropModel': AquaCropModel,
+            'Soil': Soil,
+            'Crop': Crop,
+            'InitialWaterContent': InitialWaterContent,
+            'prepare_weather': prepare_weather,
+            'get_filepath': get_filepath,
+            'use_mock': False,
+        }
+    except (ImportError, FileNotFoundError, OSError) as e:
+        logger.warning(f"Real AquaCrop not available ({e}), using mock implementation for demonstration")
+        import sys
+        model_dir = str(Path(__file__).parent.parent / "model")
+        if model_dir not in sys.path:
+            sys.path.insert(0, model_dir)
+        from mock_aquacrop import get_mock_aquacrop
+        mods: Dict[str, Any] = dict(get_mock_aquacrop())
+        mods['use_mock'] = True
+        return mods
+
+
 def predict_wheat_yield(crop_type: str = "Wheat", planting_date: str = "10/01", 
                        soil_type: str = "SandyLoam", sim_years: int = 6) -> str:
     """Predict wheat yield using AquaCrop model based on user inputs.
@@ -322,7 +738,7 @@ def predict_wheat_yield(crop_type: str = "Wheat", planting_date: str = "10/01",
     Returns:
         JSON string with simulation results and yield prediction
     """
-    logger = get_logger()
+    logger = _logger
     log_function_call("predict_wheat_yield", {
         "crop_type": crop_type, 
         "planting_date": planting_date, 
@@ -331,54 +747,14 @@ def predict_wheat_yield(crop_type: str = "Wheat", planting_date: str = "10/01",
     })
     
     try:
-        # Fix for AquaCrop on macOS - ensure 'python' command is available
-        import os
-        import subprocess
-        from pathlib import Path
-        
-        def setup_python_alias():
-            """Set up python alias for AquaCrop compatibility."""
-            try:
-                subprocess.run(['python', '--version'], check=True, capture_output=True)
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                python3_path = subprocess.run(['which', 'python3'], capture_output=True, text=True).stdout.strip()
-                if python3_path:
-                    os.environ['PATH'] = f"{os.path.dirname(python3_path)}:{os.environ.get('PATH', '')}"
-                    temp_dir = Path.home() / '.local' / 'bin'
-                    temp_dir.mkdir(parents=True, exist_ok=True)
-                    python_link = temp_dir / 'python'
-                    if not python_link.exists():
-                        try:
-                            python_link.symlink_to(python3_path)
-                            os.environ['PATH'] = f"{temp_dir}:{os.environ.get('PATH', '')}"
-                        except (OSError, PermissionError):
-                            pass
-        
-        setup_python_alias()
-        
-        # Try to import real AquaCrop modules
-        use_mock = True  # Default to mock due to AquaCrop compatibility issues
-        try:
-            from aquacrop import AquaCropModel, Soil, Crop, InitialWaterContent
-            from aquacrop.utils import prepare_weather, get_filepath
-            # Test if AquaCrop actually works by trying to create a simple object
-            test_soil = Soil(soil_type='SandyLoam')
-            use_mock = False
-            logger.info("Real AquaCrop loaded successfully")
-        except (ImportError, FileNotFoundError, OSError) as e:
-            logger.warning(f"Real AquaCrop not available ({e}), using mock implementation for demonstration")
-            import sys
-            sys.path.insert(0, str(Path(__file__).parent.parent / "model"))
-            from mock_aquacrop import get_mock_aquacrop
-            mock_modules = get_mock_aquacrop()
-            AquaCropModel = mock_modules['AquaCropModel']
-            Soil = mock_modules['Soil']
-            Crop = mock_modules['Crop']
-            InitialWaterContent = mock_modules['InitialWaterContent']
-            prepare_weather = mock_modules['prepare_weather']
-            get_filepath = mock_modules['get_filepath']
-        
-        import pandas as pd
+        mods = _load_aquacrop()
+        use_mock = mods['use_mock']
+        AquaCropModel = mods['AquaCropModel']
+        Soil = mods['Soil']
+        Crop = mods['Crop']
+        InitialWaterContent = mods['InitialWaterContent']
+        prepare_weather = mods['prepare_weather']
+        get_filepath = mods['get_filepath']
         
         logger.info("Starting AquaCrop wheat yield simulation...")
         
@@ -464,28 +840,34 @@ def predict_wheat_yield(crop_type: str = "Wheat", planting_date: str = "10/01",
                 break
         
         if not results.empty and yield_column:
-            # Calculate basic yield statistics
-            total_yield = results[yield_column].sum()
-            avg_yield = results[yield_column].mean()
-            max_yield = results[yield_column].max()
-            min_yield = results[yield_column].min()
-            final_yield = results[yield_column].iloc[-1] if not results.empty else 0
+            # Calculate basic yield statistics on the raw ndarray: one
+            # Series materialization instead of five pandas passes
+            arr = results[yield_column].to_numpy()
+            total_yield = float(arr.sum())
+            avg_yield = float(arr.mean())
+            max_yield = float(arr.max())
+            min_yield = float(arr.min())
+            final_yield = float(arr[-1])
             
             # Calculate seasonal yields (harvest periods)
             seasonal_yields = []
             if 'Season' in results.columns and 'Harvest Date (YYYY/MM/DD)' in results.columns:
-                # Get unique seasons and their yields
-                for season in results['Season'].unique():
-                    if pd.notna(season):
-                        season_data = results[results['Season'] == season]
-                        if not season_data.empty and yield_column in season_data.columns:
-                            season_yield = season_data[yield_column].iloc[-1]  # Last value in season
-                            harvest_date = season_data['Harvest Date (YYYY/MM/DD)'].iloc[-1] if 'Harvest Date (YYYY/MM/DD)' in season_data.columns else "Unknown"
-                            seasonal_yields.append({
-                                'season': int(season),
-                                'harvest_date': str(harvest_date),
-                                'yield_tonne_per_ha': round(season_yield, 2)
-                            })
+                # Single groupby pass; the old loop re-scanned the whole
+                # table with a boolean mask per season
+                grouped = (
+                    results[results['Season'].notna()]
+                    .groupby('Season', sort=True)
+                    .agg(
+                        yield_=(yield_column, 'last'),
+                        harvest=('Harvest Date (YYYY/MM/DD)', 'last'),
+                    )
+                )
+                for season, row in grouped.iterrows():
+                    seasonal_yields.append({
+                        'season': int(season),
+                        'harvest_date': str(row['harvest']),
+                        'yield_tonne_per_ha': round(float(row['yield_']), 2)
+                    })
             
             yield_metrics = {
                 "total_yield_tonne_per_ha": round(total_yield, 2),
@@ -16,6 +16,9 @@ class TestConfig(unittest.TestCase):
         """Set up test environment."""
         self.temp_dir = tempfile.mkdtemp()
         self.temp_path = Path(self.temp_dir)
+        # load_env is memoized per process; reset so each test re-parses
+        config._env_loaded = False
+        os.environ.pop("_ENV_LOADED", None)
 
     def tearDown(self):
         """Clean up test environment."""